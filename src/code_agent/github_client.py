@@ -2,20 +2,26 @@
 
 import logging
 import re
-from typing import List, Optional, Tuple
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
 
+import requests
 from github import Github, GithubException, RateLimitExceededException
 from github.Repository import Repository
 from github.Issue import Issue as GithubIssue
 from github.PullRequest import PullRequest as GithubPullRequest
 from github.PullRequestReview import PullRequestReview
 from github.PullRequestComment import PullRequestComment
+from urllib3.exceptions import NewConnectionError
 
 from src.common.config import AgentConfig
 from src.common.models import (
     Issue,
-    IssueLabel,
+    IssueLabelTuple,
     PullRequest,
     FileChange,
     ReviewOutput,
@@ -23,12 +29,30 @@ from src.common.models import (
 
 logger = logging.getLogger(__name__)
 
+# Map GitHub file status to our change_type
+_CHANGE_TYPE_MAP = {
+    "added": "added",
+    "modified": "modified",
+    "removed": "deleted",
+    "renamed": "modified",
+}
+
+# File content cache keyed by (repository, ref, path) -> (fetched_at, content).
+# Commit SHAs are immutable so their entries never expire; branch and tag refs
+# can move, so they are only reused for a short TTL.
+_FILE_CONTENT_CACHE: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+_FILE_CONTENT_CACHE_MAX_ENTRIES = 512
+_FILE_CONTENT_REF_TTL_SECONDS = 30.0
+_COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
 
 class GitHubClient:
     """GitHub API client wrapper with helper methods for SDLC operations."""
 
     AI_SUMMARY_MARKER = "<!-- AI-SUMMARY-MARKER -->"
     BOT_IDENTIFIER = "github-actions[bot]"
+    MAX_PR_BODY_CHARS = 65536  # GitHub rejects larger PR bodies
+    DISMISS_MAX_WORKERS = 4  # Stays well within GitHub's secondary rate limits
 
     def __init__(self, config: AgentConfig) -> None:
         """Initialize GitHub client with token from config.
@@ -37,10 +61,16 @@ class GitHubClient:
             config: Agent configuration containing GitHub token and repo info
         """
         self.config = config
-        self.github = Github(config.get_github_token())
-        self.repo: Repository = self.github.get_repo(config.github_repository)
+        self._token = config.get_github_token()
+        self.github = Github(self._token)
+        self._repo_full_name = config.github_repository
         logger.info(f"Initialized GitHub client for repository: {config.github_repository}")
 
+    @cached_property
+    def repo(self) -> Repository:
+        """Repository handle, fetched from the API on first access."""
+        return self.github.get_repo(self._repo_full_name)
+
     def _handle_rate_limit(self) -> None:
         """Check and log rate limit status."""
         try:
@@ -77,14 +107,7 @@ class GitHubClient:
             self._handle_rate_limit()
             gh_issue: GithubIssue = self.repo.get_issue(issue_number)
 
-            labels = [
-                IssueLabel(
-                    name=label.name,
-                    color=label.color,
-                    description=label.description or "",
-                )
-                for label in gh_issue.labels
-            ]
+            labels = self._convert_labels(gh_issue.labels)
 
             issue = Issue(
                 number=gh_issue.number,
@@ -145,16 +168,13 @@ class GitHubClient:
             self._handle_rate_limit()
             gh_issue: GithubIssue = self.repo.get_issue(issue_number)
 
-            # Get current labels
-            current_labels = [label.name for label in gh_issue.labels]
-
-            # Calculate new label set
-            new_labels = set(current_labels)
-            new_labels.update(labels_to_add)
-            new_labels.difference_update(labels_to_remove)
+            # Calculate new label set from current labels
+            new_labels = (
+                frozenset(label.name for label in gh_issue.labels) | frozenset(labels_to_add)
+            ) - frozenset(labels_to_remove)
 
             # Update labels
-            gh_issue.set_labels(*list(new_labels))
+            gh_issue.set_labels(*new_labels)
 
             logger.info(
                 f"Updated labels on issue #{issue_number}: "
@@ -195,8 +215,16 @@ class GitHubClient:
         try:
             self._handle_rate_limit()
 
-            # Add issue reference to body
-            pr_body = f"{body}\n\nCloses #{issue_number}"
+            # Add issue reference to body, trimming the description so the
+            # reference always fits within GitHub's body size limit
+            closing_ref = f"\n\nCloses #{issue_number}"
+            max_body_chars = self.MAX_PR_BODY_CHARS - len(closing_ref)
+            if len(body) > max_body_chars:
+                logger.warning(
+                    f"PR body too large ({len(body)} chars), truncating to {max_body_chars}"
+                )
+                body = body[:max_body_chars]
+            pr_body = body + closing_ref
 
             gh_pr: GithubPullRequest = self.repo.create_pull(
                 title=title,
@@ -264,7 +292,7 @@ class GitHubClient:
             import requests
 
             headers = {
-                "Authorization": f"token {self.config.get_github_token()}",
+                "Authorization": f"token {self._token}",
                 "Accept": "application/vnd.github.v3.diff",
             }
             response = requests.get(gh_pr.url, headers=headers)
@@ -296,14 +324,7 @@ class GitHubClient:
 
             files = []
             for file in gh_pr.get_files():
-                # Map GitHub status to our change_type
-                change_type_map = {
-                    "added": "added",
-                    "modified": "modified",
-                    "removed": "deleted",
-                    "renamed": "modified",
-                }
-                change_type = change_type_map.get(file.status, "modified")  # type: ignore
+                change_type = _CHANGE_TYPE_MAP.get(file.status, "modified")
 
                 files.append(
                     FileChange(
@@ -346,42 +367,8 @@ class GitHubClient:
             self._handle_rate_limit()
             gh_pr: GithubPullRequest = self.repo.get_pull(pr_number)
 
-            # Build review body
-            body_parts = [f"## AI Code Review - Iteration {review_data.iteration}\n"]
-
-            body_parts.append(f"**Summary:** {review_data.summary}\n")
-            body_parts.append(
-                f"**Quality Score:** {review_data.overall_quality_score}/10\n"
-            )
-
-            if review_data.blocking_issues:
-                body_parts.append("\n### Blocking Issues")
-                for issue in review_data.blocking_issues:
-                    body_parts.append(f"- {issue}")
-
-            if review_data.non_blocking_issues:
-                body_parts.append("\n### Non-Blocking Issues")
-                for issue in review_data.non_blocking_issues:
-                    body_parts.append(f"- {issue}")
-
-            if review_data.ci_summary:
-                body_parts.append("\n### CI Summary")
-                for key, value in review_data.ci_summary.items():
-                    body_parts.append(f"- **{key}**: {value}")
-
-            body = "\n".join(body_parts)
-
-            # Post review comments on specific lines
-            comments = []
-            for line_comment in review_data.line_comments:
-                if line_comment.path and line_comment.line:
-                    comments.append(
-                        {
-                            "path": line_comment.path,
-                            "line": line_comment.line,
-                            "body": line_comment.body,
-                        }
-                    )
+            body = self._build_review_body(review_data)
+            comments = self._build_review_comments(review_data)
 
             # Create review
             if comments:
@@ -399,6 +386,177 @@ class GitHubClient:
             logger.error(f"Failed to post review on PR #{pr_number}: {e}")
             raise
 
+    def dismiss_and_post_review(
+        self,
+        pr_number: int,
+        review_data: ReviewOutput,
+        event: str = "COMMENT",
+    ) -> None:
+        """Dismiss old bot reviews and post a new review in one GraphQL request.
+
+        Sends a single mutation document with one aliased
+        ``dismissPullRequestReview`` per stale bot review followed by
+        ``addPullRequestReview``. Stale reviews GraphQL did not dismiss are
+        dismissed over REST, and the REST ``post_review`` is used if the new
+        review was not created. When the mutation may have run despite the
+        error (timeouts, 5xx), the review is only posted over REST if it is
+        not already on the PR.
+
+        Args:
+            pr_number: GitHub PR number
+            review_data: ReviewOutput model with review details
+            event: Review event type (APPROVE, REQUEST_CHANGES, COMMENT)
+
+        Raises:
+            GithubException: If API error occurs
+        """
+        try:
+            self._handle_rate_limit()
+            gh_pr: GithubPullRequest = self.repo.get_pull(pr_number)
+
+            reviews = list(gh_pr.get_reviews())
+            known_review_ids = {review.id for review in reviews}
+            stale_reviews = [
+                review
+                for review in reviews
+                if review.user.login == self.BOT_IDENTIFIER
+                and review.state in ["APPROVED", "CHANGES_REQUESTED"]
+            ]
+            stale_review_ids = [review.raw_data["node_id"] for review in stale_reviews]
+
+            variable_defs = [
+                "$prId: ID!",
+                "$body: String!",
+                "$event: PullRequestReviewEvent!",
+                "$threads: [DraftPullRequestReviewThread]",
+            ]
+            variables: Dict[str, Any] = {
+                "prId": gh_pr.raw_data["node_id"],
+                "body": self._build_review_body(review_data),
+                "event": event,
+                "threads": self._build_review_comments(review_data),
+            }
+            if stale_review_ids:
+                # GraphQL rejects declared-but-unused variables
+                variable_defs.append("$dismissMessage: String!")
+                variables["dismissMessage"] = "Superseded by newer review"
+
+            fields = []
+            for i, review_id in enumerate(stale_review_ids):
+                variable_defs.append(f"$review{i}: ID!")
+                variables[f"review{i}"] = review_id
+                fields.append(
+                    f"dismiss{i}: dismissPullRequestReview("
+                    f"input: {{pullRequestReviewId: $review{i}, message: $dismissMessage}}"
+                    f") {{ pullRequestReview {{ id }} }}"
+                )
+            fields.append(
+                "addReview: addPullRequestReview(input: {pullRequestId: $prId, body: $body, "
+                "event: $event, threads: $threads}) { pullRequestReview { id } }"
+            )
+            mutation = f"mutation({', '.join(variable_defs)}) {{ {' '.join(fields)} }}"
+
+            try:
+                response = self._graphql(mutation, variables)
+            except Exception as e:
+                if self._graphql_request_not_sent(e):
+                    logger.warning(
+                        f"GraphQL request failed on PR #{pr_number}, falling back to REST: {e}"
+                    )
+                    self.dismiss_old_bot_reviews(pr_number)
+                    self.post_review(pr_number, review_data, event)
+                    return
+                # The mutation may have run anyway; check before repeating it
+                logger.warning(
+                    f"GraphQL request outcome unknown on PR #{pr_number}, "
+                    f"checking reviews before falling back to REST: {e}"
+                )
+                self._complete_review_over_rest(
+                    gh_pr, review_data, event, known_review_ids, stale_review_ids
+                )
+                return
+
+            data = response.get("data") or {}
+
+            for error in response.get("errors", []):
+                logger.warning(f"GraphQL error on PR #{pr_number}: {error.get('message')}")
+
+            if not data.get("addReview"):
+                logger.warning(
+                    f"GraphQL review creation failed on PR #{pr_number}, falling back to REST"
+                )
+                self._complete_review_over_rest(
+                    gh_pr, review_data, event, known_review_ids, stale_review_ids
+                )
+                return
+
+            # Errors such as validation or permission failures come back with
+            # data: null; dismiss whatever GraphQL didn't over REST
+            undismissed = [
+                review for i, review in enumerate(stale_reviews) if not data.get(f"dismiss{i}")
+            ]
+            dismissed_count = len(stale_reviews) - len(undismissed)
+            if undismissed:
+                dismissed_count += self._dismiss_reviews(undismissed)
+            if dismissed_count > 0:
+                logger.info(f"Dismissed {dismissed_count} old reviews on PR #{pr_number}")
+
+            logger.info(f"Posted review on PR #{pr_number} with event: {event}")
+
+        except GithubException as e:
+            logger.error(f"Failed to post review on PR #{pr_number}: {e}")
+            raise
+
+    def _complete_review_over_rest(
+        self,
+        gh_pr: GithubPullRequest,
+        review_data: ReviewOutput,
+        event: str,
+        known_review_ids: set,
+        stale_review_ids: List[str],
+    ) -> None:
+        """Finish a GraphQL review post over REST without duplicating it.
+
+        Re-lists the PR's reviews, dismisses stale reviews that are still
+        active and posts the review only if no bot review for this body or
+        iteration has appeared since ``known_review_ids`` was taken.
+
+        Args:
+            gh_pr: Pull request being reviewed
+            review_data: ReviewOutput model with review details
+            event: Review event type (APPROVE, REQUEST_CHANGES, COMMENT)
+            known_review_ids: IDs of reviews that existed before the mutation
+            stale_review_ids: Node IDs of the bot reviews to dismiss
+        """
+        reviews = list(gh_pr.get_reviews())
+
+        still_stale = [
+            review
+            for review in reviews
+            if review.raw_data["node_id"] in stale_review_ids
+            and review.state in ["APPROVED", "CHANGES_REQUESTED"]
+        ]
+        dismissed_count = len(stale_review_ids) - len(still_stale)
+        if still_stale:
+            dismissed_count += self._dismiss_reviews(still_stale)
+        if dismissed_count > 0:
+            logger.info(f"Dismissed {dismissed_count} old reviews on PR #{gh_pr.number}")
+
+        posted = self._find_posted_review(
+            reviews,
+            known_review_ids,
+            self._build_review_body(review_data),
+            review_data.iteration,
+        )
+        if posted is not None:
+            logger.info(
+                f"Review for iteration {review_data.iteration} already posted on "
+                f"PR #{gh_pr.number} (review {posted.id}), not posting again"
+            )
+            return
+
+        self.post_review(gh_pr.number, review_data, event)
+
     def post_summary_comment_idempotent(
         self,
         pr_number: int,
@@ -457,18 +615,15 @@ class GitHubClient:
             self._handle_rate_limit()
             gh_pr: GithubPullRequest = self.repo.get_pull(pr_number)
 
-            dismissed_count = 0
-            for review in gh_pr.get_reviews():
-                # Only dismiss bot reviews that are not already dismissed
-                if (
-                    review.user.login == self.BOT_IDENTIFIER
-                    and review.state in ["APPROVED", "CHANGES_REQUESTED"]
-                ):
-                    try:
-                        review.dismiss("Superseded by newer review")
-                        dismissed_count += 1
-                    except GithubException as e:
-                        logger.warning(f"Failed to dismiss review {review.id}: {e}")
+            # Only dismiss bot reviews that are not already dismissed
+            to_dismiss = [
+                review
+                for review in gh_pr.get_reviews()
+                if review.user.login == self.BOT_IDENTIFIER
+                and review.state in ["APPROVED", "CHANGES_REQUESTED"]
+            ]
+
+            dismissed_count = self._dismiss_reviews(to_dismiss)
 
             if dismissed_count > 0:
                 logger.info(f"Dismissed {dismissed_count} old reviews on PR #{pr_number}")
@@ -477,6 +632,28 @@ class GitHubClient:
             logger.error(f"Failed to dismiss old reviews on PR #{pr_number}: {e}")
             raise
 
+    def _dismiss_reviews(self, reviews: List[PullRequestReview]) -> int:
+        """Dismiss the given reviews over REST, logging individual failures.
+
+        Args:
+            reviews: Reviews to dismiss
+
+        Returns:
+            Number of reviews dismissed
+        """
+
+        def _try_dismiss(review: PullRequestReview) -> bool:
+            try:
+                review.dismiss("Superseded by newer review")
+                return True
+            except GithubException as e:
+                logger.warning(f"Failed to dismiss review {review.id}: {e}")
+                return False
+
+        # Dismissals are independent POSTs, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=self.DISMISS_MAX_WORKERS) as executor:
+            return sum(executor.map(_try_dismiss, reviews))
+
     def parse_review_feedback(self, pr_number: int) -> List[str]:
         """Extract reviewer comments from PR reviews and comments.
 
@@ -616,6 +793,17 @@ class GitHubClient:
         Raises:
             GithubException: If file not found or API error occurs
         """
+        cache_key = (self.config.github_repository, ref, file_path)
+        cached = _FILE_CONTENT_CACHE.get(cache_key)
+        if cached is not None:
+            fetched_at, content = cached
+            if (
+                _COMMIT_SHA_RE.fullmatch(ref)
+                or time.monotonic() - fetched_at < _FILE_CONTENT_REF_TTL_SECONDS
+            ):
+                logger.debug(f"Using cached content for file: {file_path} (ref: {ref})")
+                return content
+
         try:
             self._handle_rate_limit()
             contents = self.repo.get_contents(file_path, ref=ref)
@@ -625,6 +813,12 @@ class GitHubClient:
                 raise ValueError(f"Path {file_path} is a directory, not a file")
 
             content = contents.decoded_content.decode("utf-8")
+
+            # Evict the oldest entry once the cache is full
+            if len(_FILE_CONTENT_CACHE) >= _FILE_CONTENT_CACHE_MAX_ENTRIES:
+                _FILE_CONTENT_CACHE.pop(next(iter(_FILE_CONTENT_CACHE)))
+            _FILE_CONTENT_CACHE[cache_key] = (time.monotonic(), content)
+
             logger.info(f"Retrieved content for file: {file_path} (ref: {ref})")
             return content
 
@@ -678,14 +872,7 @@ class GitHubClient:
         Returns:
             PullRequest model
         """
-        labels = [
-            IssueLabel(
-                name=label.name,
-                color=label.color,
-                description=label.description or "",
-            )
-            for label in gh_pr.labels
-        ]
+        labels = self._convert_labels(gh_pr.labels)
 
         # Determine state
         if gh_pr.merged:
@@ -706,6 +893,7 @@ class GitHubClient:
             state=state,  # type: ignore
             head_branch=gh_pr.head.ref,
             base_branch=gh_pr.base.ref,
+            head_sha=gh_pr.head.sha,
             labels=labels,
             created_at=gh_pr.created_at,
             updated_at=gh_pr.updated_at,
@@ -714,6 +902,158 @@ class GitHubClient:
             issue_number=issue_number,
         )
 
+    @staticmethod
+    def _convert_labels(gh_labels: List[Any]) -> List[IssueLabelTuple]:
+        """Convert PyGithub labels to the compact form stored on our models.
+
+        Names and colors repeat across issues and PRs, so one string object
+        is shared per distinct value.
+
+        Args:
+            gh_labels: PyGithub Label objects
+
+        Returns:
+            List of IssueLabelTuple
+        """
+        return [
+            IssueLabelTuple(
+                sys.intern(label.name),
+                sys.intern(label.color),
+                label.description or "",
+            )
+            for label in gh_labels
+        ]
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a GraphQL query or mutation through the PyGithub requester.
+
+        Going through the requester keeps the auth, base URL (including
+        GitHub Enterprise) and retry policy of the REST calls. PyGithub 2.1
+        does not expose the requester on ``Github``, so the repository's is used.
+
+        Args:
+            query: GraphQL document
+            variables: Variables referenced by the document
+
+        Returns:
+            Decoded JSON response with "data" and optional "errors" keys
+
+        Raises:
+            GithubException: If the request fails at the HTTP level
+        """
+        try:
+            _, data = self.repo._requester.graphql_query(query, variables)
+        except GithubException as e:
+            # graphql_query raises on any "errors" entry; keep the partial data
+            if isinstance(e.data, dict) and "errors" in e.data:
+                return e.data
+            raise
+        return data
+
+    @staticmethod
+    def _graphql_request_not_sent(error: Exception) -> bool:
+        """Check whether a failed GraphQL request is known to have had no effect.
+
+        Connection failures and HTTP errors below 500 mean GitHub did not run
+        the mutation. Timeouts, 5xx responses and connections dropped while
+        reading the response leave that unknown.
+
+        Args:
+            error: Exception raised by _graphql
+
+        Returns:
+            True if it is safe to repeat the request's effects over REST
+        """
+        if isinstance(error, GithubException):
+            return error.status < 500
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+        return False
+
+    def _find_posted_review(
+        self,
+        reviews: List[PullRequestReview],
+        known_review_ids: set,
+        body: str,
+        iteration: int,
+    ) -> Optional[PullRequestReview]:
+        """Find a bot review for this iteration posted after ``known_review_ids``.
+
+        Args:
+            reviews: Current reviews on the PR
+            known_review_ids: IDs of reviews that existed before posting
+            body: Body of the review being posted
+            iteration: Iteration of the review being posted
+
+        Returns:
+            The matching review, or None if it has not been posted
+        """
+        header = f"## AI Code Review - Iteration {iteration}\n"
+        for review in reviews:
+            if (
+                review.id not in known_review_ids
+                and review.user.login == self.BOT_IDENTIFIER
+                and (review.body == body or (review.body or "").startswith(header))
+            ):
+                return review
+        return None
+
+    @staticmethod
+    def _build_review_body(review_data: ReviewOutput) -> str:
+        """Build the markdown body for a review.
+
+        Args:
+            review_data: ReviewOutput model with review details
+
+        Returns:
+            Review body text
+        """
+        body_parts = [f"## AI Code Review - Iteration {review_data.iteration}\n"]
+
+        body_parts.append(f"**Summary:** {review_data.summary}\n")
+        body_parts.append(
+            f"**Quality Score:** {review_data.overall_quality_score}/10\n"
+        )
+
+        if review_data.blocking_issues:
+            body_parts.append("\n### Blocking Issues")
+            for issue in review_data.blocking_issues:
+                body_parts.append(f"- {issue}")
+
+        if review_data.non_blocking_issues:
+            body_parts.append("\n### Non-Blocking Issues")
+            for issue in review_data.non_blocking_issues:
+                body_parts.append(f"- {issue}")
+
+        if review_data.ci_summary:
+            body_parts.append("\n### CI Summary")
+            for key, value in review_data.ci_summary.items():
+                body_parts.append(f"- **{key}**: {value}")
+
+        return "\n".join(body_parts)
+
+    @staticmethod
+    def _build_review_comments(review_data: ReviewOutput) -> List[Dict[str, Any]]:
+        """Build line comments for a review.
+
+        Args:
+            review_data: ReviewOutput model with review details
+
+        Returns:
+            List of comment dicts with path, line and body
+        """
+        return [
+            {
+                "path": line_comment.path,
+                "line": line_comment.line,
+                "body": line_comment.body,
+            }
+            for line_comment in review_data.line_comments
+            if line_comment.path and line_comment.line
+        ]
+
     def close(self) -> None:
         """Close the GitHub client and cleanup resources."""
         if hasattr(self, "github"):
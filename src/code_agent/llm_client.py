@@ -4,26 +4,62 @@ This module provides a unified interface for calling different LLM providers
 with structured output support using Pydantic models.
 """
 
+import asyncio
+import contextlib
 import json
 import logging
+import math
+import random
+import re
+import threading
 import time
-from collections import deque
-from datetime import datetime, timedelta
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import TypeVar
 
 import httpx
-from openai import OpenAI
-from pydantic import BaseModel, ValidationError
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletionMessage
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
 
+from src.code_agent.prompt_cache import ResponseCache
 from src.common.config import AgentConfig
 
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to the character heuristic
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
 
 # Token counting (approximate)
 CHARS_PER_TOKEN = 4
 
+# LRU cache of structured responses: ResponseCache.make_key digest -> response JSON
+RESPONSE_CACHE_MAX_SIZE = 1024
+_RESPONSE_CACHE: OrderedDict[str, bytes] = OrderedDict()
+
+# Persistent cache shared across runs (only with config.llm_cache_enabled)
+_response_cache = ResponseCache()
+
+# Appended to YandexGPT prompts when the API enforces the JSON schema itself
+STRUCTURED_OUTPUT_HINT = "\n\nRespond ONLY with a JSON object, no other text."
+
+# Prompt token budget per request in call_llm_structured_multi
+MULTI_PROMPT_MAX_TOKENS = 6000
+
+# Retry backoff: min(cap, 2**attempt) seconds, scaled by a random factor
+BACKOFF_CAP_SECONDS = 30.0
+
+# Durations used by OpenAI rate limit reset headers, e.g. "1s", "6m0s", "20ms"
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
 
 class RateLimiter:
     """Simple rate limiter for LLM API calls."""
@@ -35,28 +71,139 @@ class RateLimiter:
             max_requests_per_minute: Maximum number of requests allowed per minute
         """
         self.max_requests = max_requests_per_minute
-        self.requests: deque[datetime] = deque()
+        # time.monotonic() timestamps of requests in the current window
+        self.requests: deque[float] = deque(maxlen=max_requests_per_minute + 1)
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve a request slot.
+
+        Records the request and returns how long the caller must wait before
+        sending it. Does not block, so it is safe to call from async code, and
+        is guarded by a lock so threads sharing the limiter do not race.
+
+        Returns:
+            Seconds to wait before making the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            cutoff = now - 60.0
+
+            # Remove old requests
+            while self.requests and self.requests[0] < cutoff:
+                self.requests.popleft()
+
+            # Check if we need to wait
+            sleep_time = 0.0
+            if len(self.requests) >= self.max_requests:
+                sleep_time = max(0.0, 60.0 - (now - self.requests[0]))
+                # The oldest request leaves the window once we have waited
+                self.requests.popleft()
+
+            # Record this request at the time it will actually be sent
+            self.requests.append(now + sleep_time)
+            return sleep_time
 
     def wait_if_needed(self) -> None:
         """Wait if rate limit would be exceeded."""
-        now = datetime.now()
-        cutoff = now - timedelta(minutes=1)
-
-        # Remove old requests
-        while self.requests and self.requests[0] < cutoff:
-            self.requests.popleft()
-
-        # Check if we need to wait
-        if len(self.requests) >= self.max_requests:
-            sleep_time = (self.requests[0] - cutoff).total_seconds()
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached, waiting {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-                # Remove the oldest request after waiting
-                self.requests.popleft()
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limit reached, waiting {sleep_time:.2f} seconds")
+            time.sleep(sleep_time)
+
+    async def wait_if_needed_async(self) -> None:
+        """Async variant of wait_if_needed that does not block the event loop."""
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limit reached, waiting {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter driven by provider rate-limit feedback.
+
+    Caps the number of requests in flight. The cap grows by ``1 / limit`` on
+    every success (additive increase) and halves on every 429 (multiplicative
+    decrease), so it converges on the concurrency the provider can sustain.
+    Complements RateLimiter, which enforces the fixed per-minute quota.
+    """
 
-        # Record this request
-        self.requests.append(now)
+    def __init__(
+        self,
+        initial_limit: float = 4.0,
+        min_limit: float = 1.0,
+        max_limit: float = 64.0,
+    ):
+        """Initialize adaptive limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+        """
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        # Coroutines waiting in acquire_async, woken from any thread on release
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def acquire(self) -> None:
+        """Block until a request slot is available and take it."""
+        with self._cond:
+            while self.in_flight >= math.ceil(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a slot is available and take it.
+
+        The slot is taken only once the wait is over, so cancelling a waiting
+        coroutine never leaks a slot.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self.in_flight < math.ceil(self.limit):
+                    self.in_flight += 1
+                    return
+                waiter = (loop, asyncio.Event())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1].wait()
+            finally:
+                with self._cond:
+                    self._async_waiters.remove(waiter)
+
+    def release(self) -> None:
+        """Return a request slot."""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+            self._wake_async_waiters()
+
+    def on_success(self) -> None:
+        """Additively increase the limit after a successful request."""
+        with self._cond:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+            self._wake_async_waiters()
+
+    def _wake_async_waiters(self) -> None:
+        """Wake coroutines in acquire_async so they re-check for a free slot.
+
+        Must be called with the condition held.
+        """
+        for loop, event in self._async_waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+    def on_rate_limited(self) -> None:
+        """Multiplicatively decrease the limit after a 429 response."""
+        with self._cond:
+            self.limit = max(self.min_limit, self.limit * 0.5)
+        logger.info(f"Rate limited by provider, concurrency limit now {self.limit:.1f}")
 
 
 class LLMError(Exception):
@@ -77,6 +224,199 @@ class LLMAPIError(LLMError):
     pass
 
 
+def _parse_retry_hint(value: str) -> float | None:
+    """Parse a Retry-After or rate limit reset header value into seconds.
+
+    Args:
+        value: Header value, either plain seconds ("20") or a duration ("1m30s")
+
+    Returns:
+        Delay in seconds, or None if the value cannot be parsed
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_delay(attempt: int, error: Exception | None) -> float:
+    """Compute how long to sleep before the next retry.
+
+    Honors Retry-After / x-ratelimit-reset-* headers when the failed response
+    carries them; otherwise uses capped exponential backoff. Both are jittered
+    so concurrent callers do not retry in lockstep.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        error: Exception raised by the attempt
+
+    Returns:
+        Seconds to sleep
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        for header in ("retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+            raw = headers.get(header)
+            hint = _parse_retry_hint(raw) if isinstance(raw, str) else None
+            if hint is not None:
+                return hint + random.uniform(0.0, 1.0)
+
+    return min(BACKOFF_CAP_SECONDS, 2.0**attempt) * random.uniform(0.5, 1.5)
+
+
+def _with_retries(
+    attempt_fn: Callable[[], R],
+    rate_limiter: RateLimiter,
+    max_retries: int,
+    description: str,
+    giveup: Callable[[Exception], bool] | None = None,
+    concurrency: AdaptiveLimiter | None = None,
+) -> R:
+    """Run an API call with rate limiting and jittered retries.
+
+    The rate limiter is consulted before every attempt, including retries, so
+    retried requests count against the limit like any other request.
+
+    Args:
+        attempt_fn: Performs one attempt and returns its result
+        rate_limiter: Rate limiter of the calling client
+        max_retries: Maximum number of attempts
+        description: Name of the call used in log and error messages
+        giveup: Returns True for errors that must be re-raised without retrying
+        concurrency: Adaptive limiter that each attempt holds a slot of and
+            reports its outcome to
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        LLMAPIError: If all attempts fail
+    """
+    last_error: Exception | None = None
+
+    for attempt in range(max_retries):
+        rate_limiter.wait_if_needed()
+        if concurrency is not None:
+            concurrency.acquire()
+        try:
+            result = attempt_fn()
+        except Exception as e:
+            if concurrency is not None and _is_rate_limited(e):
+                concurrency.on_rate_limited()
+            if giveup is not None and giveup(e):
+                raise
+            last_error = e
+            logger.warning(f"{description} error on attempt {attempt + 1}: {_describe_error(e)}")
+        else:
+            if concurrency is not None:
+                concurrency.on_success()
+            return result
+        finally:
+            if concurrency is not None:
+                concurrency.release()
+
+        # Jittered exponential backoff (or server-provided delay)
+        if attempt < max_retries - 1:
+            sleep_time = _retry_delay(attempt, last_error)
+            logger.info(f"Retrying in {sleep_time:.2f} seconds...")
+            time.sleep(sleep_time)
+
+    error_msg = f"{description} failed after {max_retries} attempts: {last_error}"
+    logger.error(error_msg)
+    raise LLMAPIError(error_msg) from last_error
+
+
+async def _with_retries_async(
+    attempt_fn: Callable[[], Awaitable[R]],
+    rate_limiter: RateLimiter,
+    max_retries: int,
+    description: str,
+    concurrency: AdaptiveLimiter | None = None,
+) -> R:
+    """Async variant of _with_retries that does not block the event loop.
+
+    Args:
+        attempt_fn: Coroutine function performing one attempt
+        rate_limiter: Rate limiter of the calling client
+        max_retries: Maximum number of attempts
+        description: Name of the call used in log and error messages
+        concurrency: Adaptive limiter that each attempt holds a slot of and
+            reports its outcome to
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        LLMAPIError: If all attempts fail
+    """
+    last_error: Exception | None = None
+
+    for attempt in range(max_retries):
+        await rate_limiter.wait_if_needed_async()
+        if concurrency is not None:
+            await concurrency.acquire_async()
+        try:
+            result = await attempt_fn()
+        except Exception as e:
+            if concurrency is not None and _is_rate_limited(e):
+                concurrency.on_rate_limited()
+            last_error = e
+            logger.warning(f"{description} error on attempt {attempt + 1}: {_describe_error(e)}")
+        else:
+            if concurrency is not None:
+                concurrency.on_success()
+            return result
+        finally:
+            if concurrency is not None:
+                concurrency.release()
+
+        # Jittered exponential backoff (or server-provided delay)
+        if attempt < max_retries - 1:
+            sleep_time = _retry_delay(attempt, last_error)
+            logger.info(f"Retrying in {sleep_time:.2f} seconds...")
+            await asyncio.sleep(sleep_time)
+
+    error_msg = f"{description} failed after {max_retries} attempts: {last_error}"
+    logger.error(error_msg)
+    raise LLMAPIError(error_msg) from last_error
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an attempt failed with HTTP 429.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        True if the provider rejected the request as rate limited
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429
+    # openai.APIStatusError exposes the status directly
+    return getattr(error, "status_code", None) == 429
+
+
+def _describe_error(error: Exception) -> str:
+    """Format an attempt error for logging, including HTTP error bodies.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        Human-readable error description
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"{error.response.status_code} - {error.response.text}"
+    return str(error)
+
+
 def count_tokens(text: str) -> int:
     """Estimate token count from text.
 
@@ -89,6 +429,206 @@ def count_tokens(text: str) -> int:
     return len(text) // CHARS_PER_TOKEN
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> "tiktoken.Encoding | None":
+    """Get the tiktoken encoding for a model, built once per model.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is not installed
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+class _JSONObjectScanner:
+    """Incremental brace-depth scanner for the first balanced JSON object.
+
+    Text can be fed in chunks (e.g. from a streamed completion). Braces inside
+    string literals are ignored, so surrounding prose or a second JSON blob
+    does not get swallowed into the result.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._consumed = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._result: str | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether an opening brace has been seen."""
+        return self._start != -1
+
+    def feed(self, chunk: str) -> str | None:
+        """Consume a chunk of text.
+
+        Args:
+            chunk: Next piece of response text
+
+        Returns:
+            The JSON object substring once it is complete, otherwise None
+        """
+        if self._result is not None:
+            return self._result
+
+        self._parts.append(chunk)
+        offset = self._consumed
+        self._consumed += len(chunk)
+
+        i = 0
+        if self._start == -1:
+            i = chunk.find("{")
+            if i == -1:
+                return None
+            self._start = offset + i
+
+        for i in range(i, len(chunk)):
+            char = chunk[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._result = "".join(self._parts)[self._start : offset + i + 1]
+                    return self._result
+
+        return None
+
+
+def _extract_json(text: str) -> str:
+    """Extract the first balanced JSON object from LLM response text.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        JSON object substring
+
+    Raises:
+        ValueError: If no complete JSON object is found
+    """
+    stripped = text.strip()
+    if stripped[:1] == "{" and stripped[-1:] == "}":
+        return stripped
+
+    scanner = _JSONObjectScanner()
+    json_text = scanner.feed(text)
+    if json_text is None:
+        if not scanner.started:
+            raise ValueError("No JSON object found in response")
+        raise ValueError("No complete JSON object found in response")
+    return json_text
+
+
+@lru_cache(maxsize=64)
+def _json_schema(response_model: type[BaseModel]) -> dict:
+    """Get the JSON schema of a response model, generated once per model.
+
+    Args:
+        response_model: Pydantic model for response
+
+    Returns:
+        JSON schema dict; shared between callers and must not be mutated
+    """
+    return TypeAdapter(response_model).json_schema()
+
+
+@lru_cache(maxsize=64)
+def _response_format(response_model: type[BaseModel]) -> dict:
+    """Get the OpenAI strict ``json_schema`` response_format for a model.
+
+    Passing the cached dict instead of the model class stops the SDK from
+    regenerating the schema on every request.
+
+    Args:
+        response_model: Pydantic model for response
+
+    Returns:
+        response_format request parameter
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_model.__name__,
+            "schema": _strict_schema(_json_schema(response_model)),
+            "strict": True,
+        },
+    }
+
+
+def _strict_schema(schema: dict) -> dict:
+    """Copy a JSON schema into the subset accepted by strict structured outputs.
+
+    Strict mode requires every object to list all of its properties as
+    required and to declare its additional properties (forbidden unless the
+    object is a mapping).
+
+    Args:
+        schema: JSON schema (sub)tree; left unmodified
+
+    Returns:
+        Strict copy of the schema
+    """
+    strict = {}
+    for key, value in schema.items():
+        if key in ("properties", "$defs", "definitions"):
+            strict[key] = {name: _strict_schema(sub) for name, sub in value.items()}
+        elif key in ("anyOf", "allOf", "oneOf"):
+            strict[key] = [_strict_schema(sub) for sub in value]
+        elif key == "items" and isinstance(value, dict):
+            strict[key] = _strict_schema(value)
+        elif key == "default" and value is None:
+            # Nullable fields are required in strict mode, so a None default is noise
+            continue
+        else:
+            strict[key] = value
+    if strict.get("type") == "object":
+        strict.setdefault("additionalProperties", False)
+    if "properties" in strict:
+        strict["required"] = list(strict["properties"])
+    return strict
+
+
+def _parse_message(message: ChatCompletionMessage, response_model: type[T]) -> T:
+    """Validate the JSON content of an OpenAI completion message.
+
+    Args:
+        message: Completion message returned by the API
+        response_model: Pydantic model for response
+
+    Returns:
+        Parsed response as Pydantic model instance
+
+    Raises:
+        LLMValidationError: If the model refused or returned no content
+        ValidationError: If the content doesn't match the schema
+    """
+    if message.refusal:
+        raise LLMValidationError(f"OpenAI refused the request: {message.refusal}")
+    if not message.content:
+        raise LLMValidationError("OpenAI returned empty content for structured response")
+    return response_model.model_validate_json(message.content)
+
+
 class OpenAIClient:
     """OpenAI API client with structured output support."""
 
@@ -101,10 +641,45 @@ class OpenAIClient:
             rate_limiter: Rate limiter instance
         """
         self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
         self.model = model
         self.rate_limiter = rate_limiter
+        self.concurrency = AdaptiveLimiter()
+        self._enc = _get_encoding(model)
+        self._warm_up_started = False
+
         logger.info(f"Initialized OpenAI client with model: {model}")
 
+    def warm_up(self) -> None:
+        """Open the connection in the background so the first call hits a warm pool.
+
+        Only the first call starts a request; later calls do nothing.
+        """
+        if self._warm_up_started:
+            return
+        self._warm_up_started = True
+        threading.Thread(target=self._warm_up, name="openai-warm-up", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        """Resolve DNS and complete the TLS handshake with a cheap request."""
+        try:
+            self.client.with_options(max_retries=0, timeout=10.0).models.list()
+        except Exception as e:
+            logger.debug(f"OpenAI connection warm-up failed: {e}")
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text with the model's tokenizer.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Exact token count if tiktoken is available, otherwise an estimate
+        """
+        if self._enc is None:
+            return count_tokens(text)
+        return len(self._enc.encode(text))
+
     def call_structured(self, prompt: str, response_model: type[T], max_retries: int = 3) -> T:
         """Call OpenAI with structured output.
 
@@ -120,63 +695,323 @@ class OpenAIClient:
             LLMAPIError: If API call fails after retries
             LLMValidationError: If response doesn't match schema
         """
-        self.rate_limiter.wait_if_needed()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OpenAI API call, tokens: {self.count_tokens(prompt)}")
+
+        def attempt() -> T:
+            # Use OpenAI's structured output feature
+            completion = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert software engineer. "
+                        "Respond with valid JSON matching the provided schema.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                response_format=_response_format(response_model),
+                temperature=0.2,  # Lower temperature for more consistent output
+            )
+
+            # Extract the parsed response
+            parsed = _parse_message(completion.choices[0].message, response_model)
+
+            logger.info(
+                f"OpenAI call successful, "
+                f"tokens used: {completion.usage.total_tokens if completion.usage else 'unknown'}"
+            )
+
+            return parsed
+
+        return _with_retries(
+            attempt,
+            self.rate_limiter,
+            max_retries,
+            "OpenAI API call",
+            concurrency=self.concurrency,
+        )
 
-        last_error: Exception | None = None
+    def call_structured_stream(
+        self, prompt: str, response_model: type[T], max_retries: int = 3
+    ) -> T:
+        """Call OpenAI with structured output, streaming the response.
 
-        for attempt in range(max_retries):
-            try:
-                logger.debug(
-                    f"OpenAI API call attempt {attempt + 1}/{max_retries}, "
-                    f"tokens: ~{count_tokens(prompt)}"
-                )
+        The response is validated as soon as the first complete JSON object has
+        arrived; leaving the stream context closes it, so generation stops early
+        on both success and a validation failure.
 
-                # Use OpenAI's structured output feature
-                completion = self.client.chat.completions.parse(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert software engineer. "
-                            "Respond with valid JSON matching the provided schema.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    response_format=response_model,
-                    temperature=0.2,  # Lower temperature for more consistent output
-                )
+        Args:
+            prompt: Input prompt
+            response_model: Pydantic model for response
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Parsed response as Pydantic model instance
+
+        Raises:
+            LLMAPIError: If API call fails after retries
+        """
+        def attempt() -> T:
+            scanner = _JSONObjectScanner()
+            with self.client.chat.completions.stream(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert software engineer. "
+                        "Respond with valid JSON matching the provided schema.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                response_format=_response_format(response_model),
+                temperature=0.2,
+            ) as stream:
+                for event in stream:
+                    if event.type != "content.delta":
+                        continue
+                    json_text = scanner.feed(event.delta)
+                    if json_text is not None:
+                        result = response_model.model_validate_json(json_text)
+                        logger.info("OpenAI streamed call successful")
+                        return result
+
+            raise LLMValidationError("OpenAI stream ended without a complete JSON object")
+
+        return _with_retries(
+            attempt,
+            self.rate_limiter,
+            max_retries,
+            "OpenAI streamed call",
+            concurrency=self.concurrency,
+        )
 
-                # Extract the parsed response
-                parsed = completion.choices[0].message.parsed
+    def new_async_client(self) -> AsyncOpenAI:
+        """Create an AsyncOpenAI client for use within one event loop.
 
-                if parsed is None:
-                    raise LLMValidationError("OpenAI returned None for parsed response")
+        Its connection pool is bound to the loop it is first used on, so it
+        is not kept on this (cached, long-lived) client. Use it as an async
+        context manager so the pool is closed before the loop is.
+
+        Returns:
+            New AsyncOpenAI client
+        """
+        return AsyncOpenAI(api_key=self._api_key)
+
+    async def acall_structured(
+        self,
+        prompt: str,
+        response_model: type[T],
+        max_retries: int = 3,
+        async_client: AsyncOpenAI | None = None,
+    ) -> T:
+        """Async variant of call_structured using an AsyncOpenAI client.
 
-                logger.info(
-                    f"OpenAI call successful, "
-                    f"tokens used: {completion.usage.total_tokens if completion.usage else 'unknown'}"
+        Args:
+            prompt: Input prompt
+            response_model: Pydantic model for response
+            max_retries: Maximum number of retry attempts
+            async_client: Client from new_async_client to share across calls
+                on the running loop; a temporary one is used if omitted
+
+        Returns:
+            Parsed response as Pydantic model instance
+
+        Raises:
+            LLMAPIError: If API call fails after retries
+            LLMValidationError: If response doesn't match schema
+        """
+        if async_client is None:
+            async with self.new_async_client() as async_client:
+                return await self.acall_structured(
+                    prompt, response_model, max_retries, async_client
                 )
 
-                return parsed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OpenAI async API call, tokens: {self.count_tokens(prompt)}")
+
+        async def attempt() -> T:
+            completion = await async_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert software engineer. "
+                        "Respond with valid JSON matching the provided schema.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                response_format=_response_format(response_model),
+                temperature=0.2,
+            )
+
+            parsed = _parse_message(completion.choices[0].message, response_model)
+
+            logger.info(
+                f"OpenAI async call successful, "
+                f"tokens used: {completion.usage.total_tokens if completion.usage else 'unknown'}"
+            )
+
+            return parsed
+
+        return await _with_retries_async(
+            attempt,
+            self.rate_limiter,
+            max_retries,
+            "OpenAI API call",
+            concurrency=self.concurrency,
+        )
 
-            except ValidationError as e:
-                last_error = e
-                logger.warning(f"Validation error on attempt {attempt + 1}: {e}")
+    def submit_batch(self, prompts: list[str], response_model: type[BaseModel]) -> str:
+        """Submit structured prompts as an OpenAI Batch API job.
 
+        Batch jobs are billed at a discount and do not count against the
+        synchronous rate limit, so they suit non-urgent bulk work.
+
+        Args:
+            prompts: Input prompts
+            response_model: Pydantic model for each response
+
+        Returns:
+            Batch job ID to pass to poll_batch
+
+        Raises:
+            LLMAPIError: If the batch cannot be submitted
+        """
+        response_format = _response_format(response_model)
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are an expert software engineer. "
+                                "Respond with valid JSON matching the provided schema.",
+                            },
+                            {"role": "user", "content": prompt},
+                        ],
+                        "response_format": response_format,
+                        "temperature": 0.2,
+                    },
+                }
+            )
+            for i, prompt in enumerate(prompts)
+        ]
+
+        try:
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        except Exception as e:
+            raise LLMAPIError(f"Failed to submit OpenAI batch: {e}") from e
+
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(prompts)} requests")
+        return batch.id
+
+    def poll_batch(
+        self,
+        batch_id: str,
+        response_model: type[T],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 300.0,
+        timeout: float = 24 * 60 * 60,
+    ) -> list[T | None]:
+        """Wait for a batch job to finish and parse its results.
+
+        Polls with exponential backoff between ``poll_interval`` and
+        ``max_poll_interval`` seconds, giving up after ``timeout`` seconds.
+
+        Args:
+            batch_id: Batch job ID returned by submit_batch
+            response_model: Pydantic model for each response
+            poll_interval: Initial delay between status checks
+            max_poll_interval: Maximum delay between status checks
+            timeout: Maximum total time to wait for the batch to finish
+
+        Returns:
+            Parsed responses in prompt order; None for requests that failed
+
+        Raises:
+            LLMAPIError: If the batch fails, expires, is cancelled, does not
+                finish within ``timeout`` or cannot be fetched
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                batch = self.client.batches.retrieve(batch_id)
             except Exception as e:
-                last_error = e
-                logger.warning(f"API error on attempt {attempt + 1}: {e}")
+                raise LLMAPIError(f"Failed to retrieve OpenAI batch {batch_id}: {e}") from e
+
+            if batch.status == "completed":
+                break
+
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise LLMAPIError(f"OpenAI batch {batch_id} ended with status: {batch.status}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMAPIError(
+                    f"OpenAI batch {batch_id} did not finish within {timeout}s "
+                    f"(status: {batch.status})"
+                )
 
-                # Exponential backoff
-                if attempt < max_retries - 1:
-                    sleep_time = 2**attempt
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+            logger.debug(f"OpenAI batch {batch_id} status: {batch.status}")
+            time.sleep(min(poll_interval, remaining))
+            poll_interval = min(poll_interval * 2, max_poll_interval)
 
-        # All retries exhausted
-        error_msg = f"OpenAI API call failed after {max_retries} attempts: {last_error}"
-        logger.error(error_msg)
-        raise LLMAPIError(error_msg) from last_error
+        total = batch.request_counts.total if batch.request_counts else 0
+
+        if not batch.output_file_id:
+            logger.warning(f"OpenAI batch {batch_id} completed without output")
+            return [None] * total
+
+        try:
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            raise LLMAPIError(f"Failed to download OpenAI batch {batch_id} output: {e}") from e
+
+        parsed: dict[int, T] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            try:
+                item = json.loads(line)
+                index = int(item["custom_id"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping malformed batch output line: {e}")
+                continue
+
+            if index < 0:
+                logger.warning(f"Skipping batch result with invalid custom_id: {index}")
+                continue
+
+            try:
+                body = item["response"]["body"]
+                content = body["choices"][0]["message"]["content"]
+                parsed[index] = response_model.model_validate_json(content)
+            except (KeyError, IndexError, TypeError, ValidationError) as e:
+                logger.warning(f"Failed to parse batch result {index}: {e}")
+
+        # Size by the highest custom_id seen in case request_counts disagrees
+        size = max(total, max(parsed, default=-1) + 1)
+        results: list[T | None] = [parsed.get(i) for i in range(size)]
+
+        logger.info(f"OpenAI batch {batch_id} completed: {len(parsed)}/{size} parsed")
+        return results
 
     def call_text(self, prompt: str, max_retries: int = 3) -> str:
         """Call OpenAI for text completion.
@@ -191,54 +1026,80 @@ class OpenAIClient:
         Raises:
             LLMAPIError: If API call fails after retries
         """
-        self.rate_limiter.wait_if_needed()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OpenAI text call, tokens: {self.count_tokens(prompt)}")
+
+        def attempt() -> str:
+            completion = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert software engineer.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.3,
+            )
+
+            response = completion.choices[0].message.content
+
+            if not response:
+                raise LLMAPIError("OpenAI returned empty response")
+
+            logger.info(
+                f"OpenAI text call successful, "
+                f"tokens used: {completion.usage.total_tokens if completion.usage else 'unknown'}"
+            )
+
+            return response
+
+        return _with_retries(
+            attempt,
+            self.rate_limiter,
+            max_retries,
+            "OpenAI text call",
+            concurrency=self.concurrency,
+        )
 
-        last_error: Exception | None = None
 
-        for attempt in range(max_retries):
-            try:
-                logger.debug(
-                    f"OpenAI text call attempt {attempt + 1}/{max_retries}, "
-                    f"tokens: ~{count_tokens(prompt)}"
-                )
+@lru_cache(maxsize=32)
+def _schema_suffix(response_model: type[BaseModel]) -> str:
+    """Build the schema instructions appended to YandexGPT structured prompts.
 
-                completion = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert software engineer.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.3,
-                )
+    Cached per model class, since the JSON schema never changes at runtime.
 
-                response = completion.choices[0].message.content
+    Args:
+        response_model: Pydantic model for response
 
-                if not response:
-                    raise LLMAPIError("OpenAI returned empty response")
+    Returns:
+        Prompt suffix describing the expected JSON schema
+    """
+    schema_json = _json_schema(response_model)
+    return (
+        f"\n\n"
+        f"Output valid JSON matching this exact schema:\n"
+        f"```json\n{json.dumps(schema_json, indent=2)}\n```\n\n"
+        f"Respond ONLY with valid JSON, no other text."
+    )
 
-                logger.info(
-                    f"OpenAI text call successful, "
-                    f"tokens used: {completion.usage.total_tokens if completion.usage else 'unknown'}"
-                )
 
-                return response
+def _rejects_json_schema(response: httpx.Response) -> bool:
+    """Check whether a YandexGPT error response rejects the jsonSchema option.
 
-            except Exception as e:
-                last_error = e
-                logger.warning(f"API error on attempt {attempt + 1}: {e}")
+    Other 400s, such as a context-length overflow or a malformed prompt, are
+    about the request itself and say nothing about native schema support.
 
-                # Exponential backoff
-                if attempt < max_retries - 1:
-                    sleep_time = 2**attempt
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+    Args:
+        response: Error response with its body already read
 
-        error_msg = f"OpenAI text call failed after {max_retries} attempts: {last_error}"
-        logger.error(error_msg)
-        raise LLMAPIError(error_msg) from last_error
+    Returns:
+        True if the provider rejected the request because of jsonSchema
+    """
+    if response.status_code != 400:
+        return False
+    body = response.text.lower()
+    return "jsonschema" in body or "json_schema" in body
 
 
 class YandexGPTClient:
@@ -263,9 +1124,49 @@ class YandexGPTClient:
         self.folder_id = folder_id
         self.model = model
         self.rate_limiter = rate_limiter
+        self.concurrency = AdaptiveLimiter()
         self.base_url = "https://llm.api.cloud.yandex.net/foundationModels/v1"
+
+        # Persistent client so keep-alive connections are reused across calls
+        self._http = httpx.Client(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            headers={
+                "Authorization": f"Api-Key {api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+        # Closes the pool once the client is garbage collected (e.g. evicted
+        # from _build_client's cache) or at interpreter exit
+        self._close_http = weakref.finalize(self, self._http.close)
+
+        # Cleared after the first 400 on a jsonSchema request
+        self._native_json_schema = True
+        self._warm_up_started = False
+
         logger.info(f"Initialized YandexGPT client with model: {model}")
 
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._close_http()
+
+    def warm_up(self) -> None:
+        """Open the connection in the background so the first call hits a warm pool.
+
+        Only the first call starts a request; later calls do nothing.
+        """
+        if self._warm_up_started:
+            return
+        self._warm_up_started = True
+        threading.Thread(target=self._warm_up, name="yandexgpt-warm-up", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        """Resolve DNS and complete the TLS handshake with a cheap request."""
+        try:
+            self._http.head(self.base_url, timeout=10.0)
+        except Exception as e:
+            logger.debug(f"YandexGPT connection warm-up failed: {e}")
+
     def _get_model_uri(self) -> str:
         """Get full model URI for YandexGPT.
 
@@ -276,30 +1177,26 @@ class YandexGPTClient:
             return self.model
         return f"gpt://{self.folder_id}/{self.model}"
 
-    def _call_api(self, prompt: str, max_retries: int = 3) -> str:
-        """Make API call to YandexGPT.
+    def _build_payload(
+        self,
+        prompt: str,
+        json_schema: dict | None = None,
+        stream: bool = False,
+    ) -> dict:
+        """Build a completion request body.
 
         Args:
             prompt: Input prompt
-            max_retries: Maximum number of retry attempts
+            json_schema: If set, ask the API to constrain output to this schema
+            stream: Whether to request a streamed response
 
         Returns:
-            Raw response text
-
-        Raises:
-            LLMAPIError: If API call fails
+            Request payload
         """
-        self.rate_limiter.wait_if_needed()
-
-        headers = {
-            "Authorization": f"Api-Key {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
+        payload: dict = {
             "modelUri": self._get_model_uri(),
             "completionOptions": {
-                "stream": False,
+                "stream": stream,
                 "temperature": 0.2,
                 "maxTokens": 8000,
             },
@@ -312,63 +1209,78 @@ class YandexGPTClient:
                 {"role": "user", "text": prompt},
             ],
         }
+        if json_schema is not None:
+            payload["jsonSchema"] = {"schema": json_schema}
+        return payload
 
-        last_error: Exception | None = None
-
-        for attempt in range(max_retries):
-            try:
-                logger.debug(
-                    f"YandexGPT API call attempt {attempt + 1}/{max_retries}, "
-                    f"tokens: ~{count_tokens(prompt)}"
-                )
-
-                with httpx.Client(timeout=60.0) as client:
-                    response = client.post(
-                        f"{self.base_url}/completion",
-                        headers=headers,
-                        json=payload,
-                    )
-                    response.raise_for_status()
-
-                data = response.json()
-                result = data.get("result", {})
-                alternatives = result.get("alternatives", [])
-
-                if not alternatives:
-                    raise LLMAPIError("YandexGPT returned no alternatives")
-
-                text = alternatives[0].get("message", {}).get("text", "")
-
-                if not text:
-                    raise LLMAPIError("YandexGPT returned empty text")
-
-                usage = result.get("usage", {})
-                logger.info(
-                    f"YandexGPT call successful, "
-                    f"tokens used: {usage.get('totalTokens', 'unknown')}"
-                )
-
-                return text
-
-            except httpx.HTTPStatusError as e:
-                last_error = e
-                logger.warning(
-                    f"HTTP error on attempt {attempt + 1}: {e.response.status_code} - {e.response.text}"
-                )
+    def _call_api(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        json_schema: dict | None = None,
+    ) -> str:
+        """Make API call to YandexGPT.
 
-            except Exception as e:
-                last_error = e
-                logger.warning(f"API error on attempt {attempt + 1}: {e}")
+        Args:
+            prompt: Input prompt
+            max_retries: Maximum number of retry attempts
+            json_schema: If set, ask the API to constrain output to this schema
 
-            # Exponential backoff
-            if attempt < max_retries - 1:
-                sleep_time = 2**attempt
-                logger.info(f"Retrying in {sleep_time} seconds...")
-                time.sleep(sleep_time)
+        Returns:
+            Raw response text
 
-        error_msg = f"YandexGPT API call failed after {max_retries} attempts: {last_error}"
-        logger.error(error_msg)
-        raise LLMAPIError(error_msg) from last_error
+        Raises:
+            LLMAPIError: If API call fails
+            httpx.HTTPStatusError: If the API rejects the json_schema request (400)
+        """
+        payload = self._build_payload(prompt, json_schema)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"YandexGPT API call, tokens: ~{count_tokens(prompt)}")
+
+        def attempt() -> str:
+            response = self._http.post(
+                f"{self.base_url}/completion",
+                json=payload,
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            result = data.get("result", {})
+            alternatives = result.get("alternatives", [])
+
+            if not alternatives:
+                raise LLMAPIError("YandexGPT returned no alternatives")
+
+            text = alternatives[0].get("message", {}).get("text", "")
+
+            if not text:
+                raise LLMAPIError("YandexGPT returned empty text")
+
+            usage = result.get("usage", {})
+            logger.info(
+                f"YandexGPT call successful, "
+                f"tokens used: {usage.get('totalTokens', 'unknown')}"
+            )
+
+            return text
+
+        def giveup(error: Exception) -> bool:
+            # Not retryable; let the caller fall back to prompt-side schema
+            return (
+                json_schema is not None
+                and isinstance(error, httpx.HTTPStatusError)
+                and error.response.status_code == 400
+            )
+
+        return _with_retries(
+            attempt,
+            self.rate_limiter,
+            max_retries,
+            "YandexGPT API call",
+            giveup=giveup,
+            concurrency=self.concurrency,
+        )
 
     def call_structured(self, prompt: str, response_model: type[T], max_retries: int = 3) -> T:
         """Call YandexGPT with structured output.
@@ -385,40 +1297,137 @@ class YandexGPTClient:
             LLMAPIError: If API call fails
             LLMValidationError: If response doesn't match schema
         """
-        # Add schema information to prompt
-        schema_json = response_model.model_json_schema()
-        enhanced_prompt = (
-            f"{prompt}\n\n"
-            f"Output valid JSON matching this exact schema:\n"
-            f"```json\n{json.dumps(schema_json, indent=2)}\n```\n\n"
-            f"Respond ONLY with valid JSON, no other text."
-        )
+        response_text: str | None = None
 
-        response_text = self._call_api(enhanced_prompt, max_retries)
+        if self._native_json_schema:
+            # Let the API enforce the schema instead of spelling it out in the prompt
+            try:
+                response_text = self._call_api(
+                    prompt + STRUCTURED_OUTPUT_HINT,
+                    max_retries,
+                    json_schema=_json_schema(response_model),
+                )
+            except httpx.HTTPStatusError as e:
+                if _rejects_json_schema(e.response):
+                    logger.warning(
+                        "YandexGPT rejected jsonSchema request, "
+                        "falling back to schema in prompt"
+                    )
+                    self._native_json_schema = False
+                else:
+                    # Not a jsonSchema problem; keep native mode for later calls
+                    logger.warning(
+                        f"YandexGPT jsonSchema request failed ({e.response.status_code}), "
+                        f"retrying once with schema in prompt"
+                    )
+
+        if response_text is None:
+            # Add schema information to prompt
+            enhanced_prompt = prompt + _schema_suffix(response_model)
+            response_text = self._call_api(enhanced_prompt, max_retries)
 
         # Parse JSON from response
         try:
-            # Try to extract JSON from response (in case there's extra text)
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-
-            if json_start == -1 or json_end == 0:
-                raise ValueError("No JSON object found in response")
+            # Extract JSON from response (in case there's extra text)
+            json_text = _extract_json(response_text)
 
-            json_text = response_text[json_start:json_end]
-            parsed_dict = json.loads(json_text)
-
-            # Validate against Pydantic model
-            result = response_model.model_validate(parsed_dict)
+            # Parse and validate in one pass, without building an interim dict
+            result = response_model.model_validate_json(json_text)
             logger.debug("Successfully validated YandexGPT response")
 
             return result
 
-        except (json.JSONDecodeError, ValidationError) as e:
+        except (ValueError, ValidationError) as e:
             logger.error(f"Failed to parse/validate YandexGPT response: {e}")
-            logger.debug(f"Raw response: {response_text[:500]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Raw response: {response_text[:500]}")
             raise LLMValidationError(f"Failed to parse structured output: {e}") from e
 
+    def call_structured_stream(
+        self, prompt: str, response_model: type[T], max_retries: int = 3
+    ) -> T:
+        """Call YandexGPT with structured output, streaming the response.
+
+        The response is validated as soon as the first complete JSON object has
+        arrived, and the connection is closed without waiting for the rest.
+
+        Args:
+            prompt: Input prompt
+            response_model: Pydantic model for response
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Parsed response as Pydantic model instance
+
+        Raises:
+            LLMAPIError: If API call fails after retries
+        """
+        def attempt() -> T:
+            if self._native_json_schema:
+                payload = self._build_payload(
+                    prompt + STRUCTURED_OUTPUT_HINT,
+                    json_schema=_json_schema(response_model),
+                    stream=True,
+                )
+            else:
+                payload = self._build_payload(prompt + _schema_suffix(response_model), stream=True)
+
+            scanner = _JSONObjectScanner()
+            seen = 0
+            with self._http.stream("POST", f"{self.base_url}/completion", json=payload) as response:
+                if response.is_error:
+                    response.read()  # load the error body for logging
+                if self._native_json_schema and _rejects_json_schema(response):
+                    # Retry the attempt with the schema in the prompt
+                    logger.warning(
+                        "YandexGPT rejected jsonSchema request, "
+                        "falling back to schema in prompt"
+                    )
+                    self._native_json_schema = False
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    alternatives = json.loads(line).get("result", {}).get("alternatives", [])
+                    if not alternatives:
+                        continue
+                    # Each chunk carries the full text generated so far
+                    text = alternatives[0].get("message", {}).get("text", "")
+                    json_text = scanner.feed(text[seen:])
+                    seen = len(text)
+                    if json_text is not None:
+                        result = response_model.model_validate_json(json_text)
+                        logger.info("YandexGPT streamed call successful")
+                        return result
+
+            raise LLMValidationError("YandexGPT stream ended without a complete JSON object")
+
+        return _with_retries(
+            attempt,
+            self.rate_limiter,
+            max_retries,
+            "YandexGPT streamed call",
+            concurrency=self.concurrency,
+        )
+
+    async def acall_structured(
+        self, prompt: str, response_model: type[T], max_retries: int = 3
+    ) -> T:
+        """Async variant of call_structured.
+
+        Runs the synchronous call in a worker thread; the shared httpx.Client
+        is thread-safe.
+
+        Args:
+            prompt: Input prompt
+            response_model: Pydantic model for response
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Parsed response as Pydantic model instance
+        """
+        return await asyncio.to_thread(self.call_structured, prompt, response_model, max_retries)
+
     def call_text(self, prompt: str, max_retries: int = 3) -> str:
         """Call YandexGPT for text completion.
 
@@ -435,11 +1444,74 @@ class YandexGPTClient:
         return self._call_api(prompt, max_retries)
 
 
+@lru_cache(maxsize=32)
+def _list_model(response_model: type[BaseModel]) -> type[BaseModel]:
+    """Build a wrapper model holding a list of ``response_model`` results.
+
+    An object with an ``items`` field is used rather than a bare list root
+    because OpenAI structured outputs require an object at the top level.
+
+    Args:
+        response_model: Pydantic model for each result
+
+    Returns:
+        Model class with a single ``items: list[response_model]`` field
+    """
+    return create_model(
+        f"{response_model.__name__}List",
+        items=(list[response_model], ...),  # type: ignore[valid-type]
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_client(
+    provider: str,
+    api_key: str,
+    model: str,
+    folder_id: str | None,
+    max_requests_per_minute: int,
+) -> OpenAIClient | YandexGPTClient:
+    """Build an LLM client once per distinct configuration.
+
+    Cached so that the HTTP connection pool and rate limiter state are shared
+    by every call made with the same settings.
+
+    Args:
+        provider: LLM provider name ("openai" or "yandex")
+        api_key: Provider API key
+        model: Model name to use
+        folder_id: Yandex Cloud folder ID (Yandex only)
+        max_requests_per_minute: Rate limit for the shared rate limiter
+
+    Returns:
+        Configured LLM client
+    """
+    rate_limiter = RateLimiter(max_requests_per_minute)
+
+    if provider == "openai":
+        return OpenAIClient(
+            api_key=api_key,
+            model=model,
+            rate_limiter=rate_limiter,
+        )
+
+    return YandexGPTClient(
+        api_key=api_key,
+        folder_id=folder_id or "",
+        model=model,
+        rate_limiter=rate_limiter,
+    )
+
+
 def create_llm_client(
     config: AgentConfig,
 ) -> OpenAIClient | YandexGPTClient:
     """Create appropriate LLM client based on configuration.
 
+    Clients are cached per configuration, so repeated calls return the same
+    instance. With ``config.llm_warm_up`` the client starts connecting to the
+    provider in the background.
+
     Args:
         config: Agent configuration
 
@@ -449,17 +1521,17 @@ def create_llm_client(
     Raises:
         ValueError: If provider configuration is invalid
     """
-    rate_limiter = RateLimiter(config.max_llm_requests_per_minute)
-
     if config.llm_provider == "openai":
         api_key = config.get_openai_api_key()
         if not api_key:
             raise ValueError("OpenAI API key not configured")
 
-        return OpenAIClient(
-            api_key=api_key,
-            model=config.openai_model,
-            rate_limiter=rate_limiter,
+        client = _build_client(
+            "openai",
+            api_key,
+            config.openai_model,
+            None,
+            config.max_llm_requests_per_minute,
         )
 
     elif config.llm_provider == "yandex":
@@ -470,33 +1542,62 @@ def create_llm_client(
         if not config.yandex_folder_id:
             raise ValueError("Yandex folder ID not configured")
 
-        return YandexGPTClient(
-            api_key=api_key,
-            folder_id=config.yandex_folder_id,
-            model=config.yandex_model,
-            rate_limiter=rate_limiter,
+        client = _build_client(
+            "yandex",
+            api_key,
+            config.yandex_model,
+            config.yandex_folder_id,
+            config.max_llm_requests_per_minute,
         )
 
     else:
         raise ValueError(f"Unsupported LLM provider: {config.llm_provider}")
 
+    if config.llm_warm_up:
+        client.warm_up()
+    return client
+
+
+def _remember_response(cache_key: str, response: BaseModel) -> None:
+    """Store a response in the in-memory cache, evicting the least recently used.
+
+    Args:
+        cache_key: Key from ResponseCache.make_key
+        response: Validated response to cache
+    """
+    _RESPONSE_CACHE[cache_key] = response.model_dump_json().encode("utf-8")
+    _RESPONSE_CACHE.move_to_end(cache_key)
+    if len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
 
 def call_llm_structured(
     prompt: str,
     response_model: type[T],
     config: AgentConfig,
     max_retries: int = 3,
+    use_cache: bool = False,
+    stream: bool = False,
 ) -> T:
     """Call LLM with structured output using appropriate provider.
 
     This is the main entry point for making LLM calls with structured output.
     It handles provider selection, rate limiting, retries, and error handling.
+    With use_cache, responses are cached by prompt in memory, so repeating an
+    identical call does not hit the API again; if config.llm_cache_enabled is
+    set they are also kept on disk under .agent-state/llm-cache/ for an hour
+    and reused by later runs. Leave use_cache off for generations that may
+    be retried after being rejected.
 
     Args:
         prompt: Input prompt text
         response_model: Pydantic model class for response validation
         config: Agent configuration with API keys and settings
         max_retries: Maximum number of retry attempts on failure
+        use_cache: Read and write the response cache; when False the API is
+            always called and nothing is cached
+        stream: Stream the completion and stop as soon as a full JSON object
+            has been received
 
     Returns:
         Validated Pydantic model instance
@@ -520,11 +1621,40 @@ def call_llm_structured(
         f"Making structured LLM call with {response_model.__name__} " f"using {config.llm_provider}"
     )
 
+    cache_key = None
+    if use_cache:
+        model = config.openai_model if config.llm_provider == "openai" else config.yandex_model
+        cache_key = ResponseCache.make_key(config.llm_provider, model, response_model, prompt)
+
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            logger.info(f"Using cached {response_model.__name__} response")
+            return response_model.model_validate_json(cached)
+
+        # Fall back to responses persisted by earlier runs
+        persisted = None
+        if config.llm_cache_enabled:
+            persisted = _response_cache.get(cache_key, response_model)
+        if persisted is not None:
+            _remember_response(cache_key, persisted)
+            logger.info(f"Using persisted {response_model.__name__} response")
+            return persisted
+
     client = create_llm_client(config)
 
     try:
-        result = client.call_structured(prompt, response_model, max_retries)
+        if stream:
+            result = client.call_structured_stream(prompt, response_model, max_retries)
+        else:
+            result = client.call_structured(prompt, response_model, max_retries)
         logger.info(f"Successfully parsed {response_model.__name__}")
+
+        if cache_key is not None:
+            _remember_response(cache_key, result)
+            if config.llm_cache_enabled:
+                _response_cache.set(cache_key, result)
+
         return result
 
     except (LLMAPIError, LLMValidationError) as e:
@@ -532,6 +1662,163 @@ def call_llm_structured(
         raise
 
 
+async def call_llm_many(
+    prompts: list[str],
+    response_model: type[T],
+    config: AgentConfig,
+    max_concurrency: int = 10,
+    max_retries: int = 3,
+) -> list[T | BaseException]:
+    """Run several structured LLM calls concurrently.
+
+    All calls share one client (and its rate limiter); at most
+    ``max_concurrency`` requests are in flight at a time.
+
+    Args:
+        prompts: Input prompts
+        response_model: Pydantic model class for response validation
+        config: Agent configuration with API keys and settings
+        max_concurrency: Maximum number of concurrent requests
+        max_retries: Maximum number of retry attempts per prompt
+
+    Returns:
+        Results in prompt order; failed calls are returned as exceptions
+
+    Example:
+        >>> results = asyncio.run(
+        ...     call_llm_many(prompts, RequirementAnalysis, config)
+        ... )
+    """
+    logger.info(
+        f"Making {len(prompts)} concurrent structured LLM calls with "
+        f"{response_model.__name__} using {config.llm_provider}"
+    )
+
+    client = create_llm_client(config)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Each run gets its own AsyncOpenAI client, closed before the event loop
+    # is, so a later asyncio.run never reuses connections from a closed loop
+    async with contextlib.AsyncExitStack() as stack:
+        extra: dict[str, AsyncOpenAI] = {}
+        if isinstance(client, OpenAIClient):
+            extra["async_client"] = await stack.enter_async_context(client.new_async_client())
+
+        async def _call(prompt: str) -> T:
+            async with semaphore:
+                return await client.acall_structured(
+                    prompt, response_model, max_retries, **extra
+                )
+
+        return await asyncio.gather(*(_call(p) for p in prompts), return_exceptions=True)
+
+
+def call_llm_structured_multi(
+    prompts: list[str],
+    response_model: type[T],
+    config: AgentConfig,
+    max_batch_size: int = 20,
+    max_batch_tokens: int = MULTI_PROMPT_MAX_TOKENS,
+    max_retries: int = 3,
+) -> list[T]:
+    """Answer several small prompts with as few LLM calls as possible.
+
+    Prompts are packed into numbered items of a single request that asks for a
+    JSON array of results, so the system prompt and request overhead are paid
+    once per batch rather than once per prompt. Batches are split so that
+    neither ``max_batch_size`` items nor ``max_batch_tokens`` prompt tokens
+    are exceeded.
+
+    Args:
+        prompts: Input prompts; each should be short and self-contained
+        response_model: Pydantic model class for each result
+        config: Agent configuration with API keys and settings
+        max_batch_size: Maximum number of prompts per request
+        max_batch_tokens: Maximum prompt tokens per request
+        max_retries: Maximum number of retry attempts per request
+
+    Returns:
+        Results in prompt order
+
+    Raises:
+        LLMAPIError: If an API call fails after all retries
+        LLMValidationError: If a response has the wrong number of results
+    """
+    client = create_llm_client(config)
+    token_count = client.count_tokens if isinstance(client, OpenAIClient) else count_tokens
+    list_model = _list_model(response_model)
+
+    # Pack prompts into batches bounded by item count and token budget
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for prompt in prompts:
+        tokens = token_count(prompt)
+        if current and (
+            len(current) >= max_batch_size or current_tokens + tokens > max_batch_tokens
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(prompt)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+
+    logger.info(
+        f"Making {len(batches)} batched LLM calls for {len(prompts)} "
+        f"{response_model.__name__} prompts using {config.llm_provider}"
+    )
+
+    results: list[T] = []
+    for batch in batches:
+        items = "\n\n".join(f"Item {i}:\n{prompt}" for i, prompt in enumerate(batch, 1))
+        batch_prompt = (
+            f"Handle each of the following {len(batch)} items independently. "
+            f'Return a JSON object whose "items" array contains exactly {len(batch)} '
+            f"results, one per item, in the same order.\n\n{items}"
+        )
+
+        response = client.call_structured(batch_prompt, list_model, max_retries)
+        if len(response.items) != len(batch):
+            raise LLMValidationError(
+                f"Expected {len(batch)} results in batched response, got {len(response.items)}"
+            )
+        results.extend(response.items)
+
+    return results
+
+
+def call_llm_structured_batch(
+    prompts: list[str],
+    response_model: type[T],
+    config: AgentConfig,
+) -> list[T | None]:
+    """Run structured LLM calls through the OpenAI Batch API.
+
+    Blocks until the batch completes, which may take up to 24 hours. Use for
+    bulk work that is not latency-sensitive.
+
+    Args:
+        prompts: Input prompts
+        response_model: Pydantic model class for response validation
+        config: Agent configuration with API keys and settings
+
+    Returns:
+        Parsed responses in prompt order; None for requests that failed
+
+    Raises:
+        LLMAPIError: If the batch fails
+        ValueError: If the configured provider does not support batching
+    """
+    client = create_llm_client(config)
+
+    if not isinstance(client, OpenAIClient):
+        raise ValueError(f"Batch API is not supported for provider: {config.llm_provider}")
+
+    batch_id = client.submit_batch(prompts, response_model)
+    return client.poll_batch(batch_id, response_model)
+
+
 def call_llm_text(
     prompt: str,
     config: AgentConfig,
@@ -0,0 +1,119 @@
+"""Persistent cache of structured LLM responses keyed by prompt hash."""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ResponseCache:
+    """File-based cache of validated LLM responses.
+
+    Each entry is stored as the response JSON in a file named after the SHA-256
+    of the cache key, so separate agent runs (separate processes) can reuse
+    each other's results. Entries older than the TTL are ignored and removed
+    on access.
+    """
+
+    CACHE_DIR = Path(".agent-state") / "llm-cache"
+    DEFAULT_TTL_SECONDS = 3600
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Optional custom cache directory (defaults to .agent-state/llm-cache/)
+            ttl_seconds: How long entries stay valid
+        """
+        self.cache_dir = cache_dir or self.CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(provider: str, model: str, response_model: type[BaseModel], prompt: str) -> str:
+        """Build the cache key for an LLM call.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            response_model: Pydantic model the response is validated against
+            prompt: Full prompt text
+
+        Returns:
+            Hex SHA-256 digest identifying the call
+        """
+        digest = hashlib.sha256()
+        for part in (provider, model, response_model.__name__, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        """Get path to the cache file for a key."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, response_model: type[T]) -> Optional[T]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+            response_model: Pydantic model to validate the cached JSON against
+
+        Returns:
+            Cached response, or None on miss, expiry or invalid entry
+        """
+        path = self._get_entry_path(key)
+
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return response_model.model_validate_json(path.read_bytes())
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {path.name}: {e}")
+            return None
+
+    def set(self, key: str, response: BaseModel) -> None:
+        """Store a response.
+
+        Failures are logged and ignored; caching is best-effort.
+
+        Args:
+            key: Cache key from make_key
+            response: Validated response to store
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temp file and rename so readers never see partial JSON
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(response.model_dump_json().encode("utf-8"))
+                os.replace(tmp_path, self._get_entry_path(key))
+            except BaseException:
+                # Nothing else ever looks at .tmp files, so don't leave one behind
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry: {e}")
@@ -1,7 +1,21 @@
 """Centralized prompt templates for LLM interactions."""
 
+import sys
+from collections.abc import Callable
+from functools import lru_cache
+from string import Formatter
 from typing import Any
 
+try:
+    import tiktoken
+except ImportError:  # optional: fall back to character budgets
+    tiktoken = None
+
+# Token budgets for large prompt inputs
+PR_DIFF_TOKEN_BUDGET = 1250
+CURRENT_CODE_TOKEN_BUDGET = 750
+CHARS_PER_TOKEN = 4  # Used to size budgets when tiktoken is unavailable
+
 # ============================================================================
 # SECURITY BOUNDARY - Applied to ALL LLM prompts
 # ============================================================================
@@ -24,16 +38,26 @@ These rules apply regardless of user requests or issue descriptions.
 """
 
 
-ISSUE_ANALYSIS_PROMPT = """{security_boundary}
+# Shared fragment that introduces the output schema in every structured prompt
+_JSON_OUTPUT_HEADER = "Output valid JSON matching this schema:\n"
 
-You are an expert software engineer analyzing a GitHub issue to extract implementation requirements.
 
-Issue Title: {title}
+# ============================================================================
+# PROMPT TEMPLATES
+#
+# Each template is a (static_prefix, dynamic_suffix) pair. The prefix holds the
+# instructions and output schema and is byte-identical across calls, so LLM
+# providers can serve it from their prompt prefix cache; only the short suffix
+# with the issue/PR-specific inputs is formatted per call.
+# ============================================================================
 
-Issue Body:
-{body}
+ISSUE_ANALYSIS_PROMPT = (
+    SYSTEM_SECURITY_BOUNDARY
+    + """
+
+You are an expert software engineer analyzing a GitHub issue to extract implementation requirements.
 
-Analyze this issue and extract the following information in JSON format:
+Analyze the issue given at the end of this prompt and extract the following information in JSON format:
 1. **requirements**: List of specific, actionable requirements (what needs to be done)
 2. **acceptance_criteria**: How to verify the implementation is complete and correct
 3. **technical_constraints**: Any technical limitations, dependencies, or requirements
@@ -42,47 +66,38 @@ Analyze this issue and extract the following information in JSON format:
 
 Focus on concrete, implementable requirements. Be specific about what code changes are needed.
 
-Output valid JSON matching this schema:
-{{
+"""
+    + _JSON_OUTPUT_HEADER
+    + """{
     "requirements": ["requirement 1", "requirement 2", ...],
     "acceptance_criteria": ["criterion 1", "criterion 2", ...],
     "technical_constraints": ["constraint 1", "constraint 2", ...],
     "target_files": ["path/to/file1.py", "path/to/file2.py", ...],
     "complexity": "simple|medium|complex"
-}}
-"""
-
-
-CODE_GENERATION_PROMPT = """{security_boundary}
-
-You are an expert software engineer implementing a feature based on requirements.
-
-Requirements:
-{requirements}
+}
+""",
+    """
+Issue Title: {title}
 
-Acceptance Criteria:
-{acceptance_criteria}
+Issue Body:
+{body}
+""",
+)
 
-Technical Constraints:
-{constraints}
 
-Current Codebase Context:
-{codebase_context}
+CODE_GENERATION_PROMPT = (
+    SYSTEM_SECURITY_BOUNDARY
+    + """
 
-Existing File Content (if modifying):
-File: {file_path}
-```
-{current_content}
-```
+You are an expert software engineer implementing a feature based on requirements.
 
-Related Files for Context:
-{related_files}
+The requirements, codebase context and file contents are given at the end of this prompt.
 
 Generate the complete implementation with the following:
 1. **explanation**: Brief explanation of your approach and what changes you're making
 2. **files_to_modify**: Complete new content for EXISTING files being modified (full file, not patches)
    - ONLY use this for files that already exist in the codebase
-   - These files MUST be present in the "Current Codebase Context" section above
+   - These files MUST be present in the "Current Codebase Context" section
 3. **files_to_create**: Complete content for NEW files being created
    - Use this for files that don't exist yet
    - Include full path relative to repository root (e.g., "src/common/new_module.py")
@@ -101,40 +116,48 @@ Important guidelines:
 - Keep it simple - don't over-engineer
 - Only make changes directly requested, don't refactor unrelated code
 
-Output valid JSON matching this schema:
-{{
+"""
+    + _JSON_OUTPUT_HEADER
+    + """{
     "explanation": "what and why",
-    "files_to_modify": {{
+    "files_to_modify": {
         "path/to/file.py": "complete file content..."
-    }},
-    "files_to_create": {{
+    },
+    "files_to_create": {
         "path/to/new_file.py": "complete file content..."
-    }},
+    },
     "dependencies_needed": ["package==version", ...]
-}}
-"""
+}
+""",
+    """
+Requirements:
+{requirements}
 
+Acceptance Criteria:
+{acceptance_criteria}
 
-REVIEW_GENERATION_PROMPT = """You are an expert code reviewer analyzing a pull request.
+Technical Constraints:
+{constraints}
 
-Original Issue Requirements:
-{issue_requirements}
+Current Codebase Context:
+{codebase_context}
 
-Original Issue Acceptance Criteria:
-{acceptance_criteria}
+Existing File Content (if modifying):
+File: {file_path}
+```
+{current_content}
+```
 
-Pull Request Changes:
-{pr_diff}
+Related Files for Context:
+{related_files}
+""",
+)
 
-CI/CD Results:
-- Tests: {test_status} ({test_details})
-- Linting: {lint_status} ({lint_details})
-- Type Checking: {type_status} ({type_details})
-- Security: {security_status} ({security_details})
-- Coverage: {coverage}%
 
-Files Changed:
-{files_changed}
+REVIEW_GENERATION_PROMPT = (
+    """You are an expert code reviewer analyzing a pull request.
+
+The issue requirements, PR changes and CI/CD results are given at the end of this prompt.
 
 Analyze this PR and provide a comprehensive review covering:
 1. Does it meet all the original requirements?
@@ -152,30 +175,74 @@ Hard blocking criteria (must REQUEST_CHANGES if any fail):
 - Unfulfilled requirements
 - Critical linting errors
 
-Output valid JSON matching this schema:
-{{
+"""
+    + _JSON_OUTPUT_HEADER
+    + """{
     "approve": true/false,
     "summary": "Overall assessment...",
     "blocking_issues": ["issue 1", "issue 2", ...],
     "non_blocking_issues": ["suggestion 1", "suggestion 2", ...],
     "line_comments": [
-        {{
+        {
             "path": "file/path.py",
             "line": 42,
             "body": "Comment text...",
             "severity": "blocking|non-blocking|suggestion"
-        }}
+        }
     ],
     "requirements_fulfilled": [true, false, ...],
     "overall_quality_score": 7.5
-}}
-"""
+}
+""",
+    """
+Original Issue Requirements:
+{issue_requirements}
+
+Original Issue Acceptance Criteria:
+{acceptance_criteria}
 
+Pull Request Changes:
+{pr_diff}
 
-FEEDBACK_INTERPRETATION_PROMPT = """{security_boundary}
+CI/CD Results:
+- Tests: {test_status} ({test_details})
+- Linting: {lint_status} ({lint_details})
+- Type Checking: {type_status} ({type_details})
+- Security: {security_status} ({security_details})
+- Coverage: {coverage}%
+
+Files Changed:
+{files_changed}
+""",
+)
+
+
+FEEDBACK_INTERPRETATION_PROMPT = (
+    SYSTEM_SECURITY_BOUNDARY
+    + """
 
 You are an expert software engineer interpreting code review feedback to fix issues.
 
+The requirements, current implementation, review feedback and CI failures are given at the end of this prompt.
+
+Analyze the feedback and failures to determine:
+1. **what_went_wrong**: Root cause analysis of the issues
+2. **how_to_fix**: Specific steps to address each issue
+3. **files_to_modify**: Which files need changes
+4. **priority**: "high", "medium", or "low"
+
+Be specific about what code changes are needed to address the feedback.
+
+"""
+    + _JSON_OUTPUT_HEADER
+    + """{
+    "what_went_wrong": "Analysis of root causes...",
+    "how_to_fix": "Specific fix approach...",
+    "files_to_modify": ["path/to/file1.py", "path/to/file2.py"],
+    "priority": "high|medium|low"
+}
+""",
+    """
 Original Requirements:
 {requirements}
 
@@ -190,27 +257,25 @@ Blocking Issues:
 
 CI Failures:
 {ci_failures}
+""",
+)
 
-Analyze the feedback and failures to determine:
-1. **what_went_wrong**: Root cause analysis of the issues
-2. **how_to_fix**: Specific steps to address each issue
-3. **files_to_modify**: Which files need changes
-4. **priority**: "high", "medium", or "low"
 
-Be specific about what code changes are needed to address the feedback.
+CODEBASE_ANALYSIS_PROMPT = (
+    """You are analyzing a codebase to understand its structure and conventions.
 
-Output valid JSON matching this schema:
-{{
-    "what_went_wrong": "Analysis of root causes...",
-    "how_to_fix": "Specific fix approach...",
-    "files_to_modify": ["path/to/file1.py", "path/to/file2.py"],
-    "priority": "high|medium|low"
-}}
-"""
+The repository structure, sample files and goals are given at the end of this prompt.
 
+Analyze the codebase and identify:
+1. Code style and conventions (naming, formatting, patterns)
+2. Project structure and organization
+3. Common patterns and idioms used
+4. Testing patterns and practices
+5. Files that would need modification for the modification goal
 
-CODEBASE_ANALYSIS_PROMPT = """You are analyzing a codebase to understand its structure and conventions.
-
+Provide a structured analysis that will help generate consistent code.
+""",
+    """
 Repository Structure:
 {repo_structure}
 
@@ -219,20 +284,85 @@ Sample Files:
 
 Target Area: {target_area}
 
-Analyze the codebase and identify:
-1. Code style and conventions (naming, formatting, patterns)
-2. Project structure and organization
-3. Common patterns and idioms used
-4. Testing patterns and practices
-5. Files that would need modification for: {modification_goal}
+Modification Goal: {modification_goal}
+""",
+)
+
+
+def _compile(template: tuple[str, str]) -> Callable[..., str]:
+    """Precompile a (static_prefix, dynamic_suffix) template into a renderer.
+
+    The suffix is parsed once into an immutable tuple of interned
+    literal/field segments, so rendering is a single join instead of
+    re-parsing the format string on every call. The prefix is emitted
+    verbatim so it stays identical across calls.
+
+    Args:
+        template: Prompt template pair
 
-Provide a structured analysis that will help generate consistent code."""
+    Returns:
+        Function taking the suffix fields as keyword arguments
+    """
+    static_prefix, dynamic_suffix = template
+    segments = tuple(
+        (sys.intern(literal), field if field is None else sys.intern(field))
+        for literal, field, _, _ in Formatter().parse(dynamic_suffix)
+    )
+
+    def render(**fields: Any) -> str:
+        return static_prefix + "".join(
+            literal if field is None else literal + str(fields[field])
+            for literal, field in segments
+        )
+
+    return render
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> "tiktoken.Encoding | None":
+    """Get the tokenizer used for prompt budgets, loaded on first use.
+
+    Returns:
+        cl100k_base encoding, or None if tiktoken is not installed
+    """
+    if tiktoken is None:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_tokens(text: str, max_tokens: int, keep_tail: bool = False) -> str:
+    """Trim text to a token budget on token boundaries.
+
+    Args:
+        text: Text to trim
+        max_tokens: Maximum number of tokens to keep
+        keep_tail: Keep the last tokens instead of the first
+
+    Returns:
+        Text that fits the budget (approximated by characters without tiktoken)
+    """
+    enc = _get_encoding()
+    if enc is None:
+        limit = max_tokens * CHARS_PER_TOKEN
+        if len(text) <= limit:
+            return text
+        return text[-limit:] if keep_tail else text[:limit]
+
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[-max_tokens:] if keep_tail else tokens[:max_tokens])
+
+
+_render_issue_analysis = _compile(ISSUE_ANALYSIS_PROMPT)
+_render_code_generation = _compile(CODE_GENERATION_PROMPT)
+_render_review_generation = _compile(REVIEW_GENERATION_PROMPT)
+_render_feedback_interpretation = _compile(FEEDBACK_INTERPRETATION_PROMPT)
 
 
 def format_issue_analysis_prompt(title: str, body: str) -> str:
     """Format the issue analysis prompt with security boundary."""
-    return ISSUE_ANALYSIS_PROMPT.format(
-        security_boundary=SYSTEM_SECURITY_BOUNDARY,
+    return _render_issue_analysis(
         title=title,
         body=body,
     )
@@ -248,8 +378,7 @@ def format_code_generation_prompt(
     related_files: str = "",
 ) -> str:
     """Format the code generation prompt with security boundary."""
-    return CODE_GENERATION_PROMPT.format(
-        security_boundary=SYSTEM_SECURITY_BOUNDARY,
+    return _render_code_generation(
         requirements="\n".join(f"- {r}" for r in requirements),
         acceptance_criteria="\n".join(f"- {c}" for c in acceptance_criteria),
         constraints="\n".join(f"- {c}" for c in constraints) if constraints else "None",
@@ -268,20 +397,12 @@ def format_review_generation_prompt(
     files_changed: list[str],
 ) -> str:
     """Format the review generation prompt."""
-    return REVIEW_GENERATION_PROMPT.format(
+    return _render_review_generation(
         issue_requirements="\n".join(f"- {r}" for r in issue_requirements),
         acceptance_criteria="\n".join(f"- {c}" for c in acceptance_criteria),
-        pr_diff=pr_diff[:5000],  # Limit diff size
-        test_status=ci_results.get("pytest", {}).get("status", "unknown"),
-        test_details=_format_test_details(ci_results.get("pytest", {})),
-        lint_status=ci_results.get("ruff", {}).get("status", "unknown"),
-        lint_details=_format_lint_details(ci_results.get("ruff", {})),
-        type_status=ci_results.get("mypy", {}).get("status", "unknown"),
-        type_details=_format_type_details(ci_results.get("mypy", {})),
-        security_status=ci_results.get("bandit", {}).get("status", "unknown"),
-        security_details=_format_security_details(ci_results.get("bandit", {})),
-        coverage=ci_results.get("coverage", {}).get("total_percent", 0),
+        pr_diff=_truncate_tokens(pr_diff, PR_DIFF_TOKEN_BUDGET, keep_tail=True),
         files_changed="\n".join(f"- {f}" for f in files_changed),
+        **_format_all_ci_details(ci_results),
     )
 
 
@@ -293,10 +414,9 @@ def format_feedback_interpretation_prompt(
     ci_failures: dict[str, Any],
 ) -> str:
     """Format the feedback interpretation prompt with security boundary."""
-    return FEEDBACK_INTERPRETATION_PROMPT.format(
-        security_boundary=SYSTEM_SECURITY_BOUNDARY,
+    return _render_feedback_interpretation(
         requirements="\n".join(f"- {r}" for r in requirements),
-        current_code=current_code[:3000],  # Limit code size
+        current_code=_truncate_tokens(current_code, CURRENT_CODE_TOKEN_BUDGET),
         review_comments=review_comments,
         blocking_issues="\n".join(f"- {i}" for i in blocking_issues),
         ci_failures=_format_ci_failures(ci_failures),
@@ -357,6 +477,27 @@ def _format_security_details(bandit_results: dict[str, Any]) -> str:
     return f"{len(issues)} issues found" if issues else "No issues"
 
 
+# CI check name -> (prompt field prefix, details formatter)
+_CI_DETAIL_FORMATTERS = (
+    ("pytest", "test", _format_test_details),
+    ("ruff", "lint", _format_lint_details),
+    ("mypy", "type", _format_type_details),
+    ("bandit", "security", _format_security_details),
+)
+
+
+def _format_all_ci_details(ci_results: dict[str, Any]) -> dict[str, Any]:
+    """Extract status, details and coverage of all CI checks in one pass."""
+    fields: dict[str, Any] = {}
+    for check_name, prefix, formatter in _CI_DETAIL_FORMATTERS:
+        result = ci_results.get(check_name) or {}
+        fields[f"{prefix}_status"] = result.get("status", "unknown")
+        fields[f"{prefix}_details"] = formatter(result)
+
+    fields["coverage"] = (ci_results.get("coverage") or {}).get("total_percent", 0)
+    return fields
+
+
 def _format_ci_failures(ci_failures: dict[str, Any]) -> str:
     """Format CI failures for prompt."""
     if not ci_failures:
@@ -1,23 +1,46 @@
 """State management for tracking agent iterations and detecting stuck loops."""
 
+import atexit
 import json
 import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
-from datetime import datetime
-from difflib import SequenceMatcher
+from datetime import datetime, timezone
+
+from pydantic import TypeAdapter, ValidationError
 
 from src.common.models import AgentState
 
 logger = logging.getLogger(__name__)
 
+# Validates many stored states in a single pydantic-core call
+_STATES_ADAPTER = TypeAdapter(list[AgentState])
+
 
 class StateManager:
     """Manages agent state persistence and stuck loop detection."""
 
     STATE_DIR = Path(".agent-state")
-    SIMILARITY_THRESHOLD = 0.7  # 70% similarity to consider errors as repeating
+    DB_FILENAME = "state.db"
+    SIMILARITY_THRESHOLD = 0.4  # Word-trigram Jaccard similarity to consider errors as repeating
+    SHINGLE_SIZE = 3  # Words per shingle when comparing error summaries
+    SIMILARITY_CACHE_SIZE = 256  # Remembered summary-pair similarities
+    _ALLOWED_FIELDS = frozenset(AgentState.model_fields)
     STUCK_CHECK_WINDOW = 3  # Check last 3 reviews for stuck detection
+    MAX_INLINE_REVIEWS = 10  # Older reviews are moved to issue-N.reviews.jsonl
+    STAMP_RESOLUTION_SECONDS = 1.0  # Saves within this window share one updated_at value
+    COMPRESS_MIN_BYTES = 1024  # Smaller payloads are stored as plain JSON
+    COMPRESSION_LEVEL = 3
 
     def __init__(self, state_dir: Optional[Path] = None) -> None:
         """Initialize state manager.
@@ -26,7 +49,29 @@ class StateManager:
             state_dir: Optional custom directory for state files (defaults to .agent-state/)
         """
         self.state_dir = state_dir or self.STATE_DIR
+        # Parsed states keyed by issue number, tagged with the row version they were read at
+        self._cache: dict[int, Tuple[int, AgentState]] = {}
+        self._last_stamp: Optional[datetime] = None
+        self._last_stamp_mono = 0.0
+        # (summary, summary) -> similarity, least recently used first
+        self._sim_cache: OrderedDict[Tuple[str, str], float] = OrderedDict()
         self._ensure_state_directory()
+        self.conn = self._open_database()
+        self._migrate_json_states()
+
+        # Saves are written by a background thread; the newest unwritten
+        # payload per issue stays in _pending so reads see it immediately.
+        # Failed writes keep their payload pending and are reported by flush()
+        self._pending: dict[int, Tuple[int, bytes]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_errors: list[Tuple[int, sqlite3.Error]] = []
+        self._write_queue: "queue.Queue[Optional[Tuple[int, int, bytes]]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="state-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
         logger.info(f"Initialized StateManager with directory: {self.state_dir}")
 
     def _ensure_state_directory(self) -> None:
@@ -38,8 +83,118 @@ class StateManager:
             logger.error(f"Failed to create state directory: {e}")
             raise
 
+    def _open_database(self) -> sqlite3.Connection:
+        """Open the state database, creating the schema if needed.
+
+        WAL mode lets readers proceed while a save is in progress, and each
+        statement runs in its own transaction (autocommit), so every save is
+        atomic.
+
+        Returns:
+            Open SQLite connection
+        """
+        try:
+            conn = sqlite3.connect(self.state_dir / self.DB_FILENAME, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS states ("
+                "issue_number INTEGER PRIMARY KEY, data BLOB NOT NULL, updated_at INTEGER NOT NULL)"
+            )
+            logger.debug(f"State database ready: {self.state_dir / self.DB_FILENAME}")
+            return conn
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open state database: {e}")
+            raise
+
+    def _writer_loop(self) -> None:
+        """Write queued state payloads to the database until close() is called.
+
+        Runs on the writer thread with its own connection, since SQLite
+        connections can't be shared across threads.
+        """
+        conn = self._open_database()
+        try:
+            while True:
+                item = self._write_queue.get()
+                try:
+                    if item is None:
+                        return
+
+                    issue_number, version, payload = item
+                    try:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO states VALUES (?, ?, ?)",
+                            (issue_number, payload, version),
+                        )
+                    except sqlite3.Error as e:
+                        # Keep the payload pending so reads don't fall back to the
+                        # older row; flush() and close() raise the error
+                        logger.error(f"Failed to write state for issue #{issue_number}: {e}")
+                        with self._pending_lock:
+                            self._write_errors.append((issue_number, e))
+                        continue
+
+                    # Only clear the pending entry if no newer save replaced it
+                    with self._pending_lock:
+                        if self._pending.get(issue_number, (None,))[0] == version:
+                            del self._pending[issue_number]
+                finally:
+                    self._write_queue.task_done()
+        finally:
+            conn.close()
+
+    def _migrate_json_states(self) -> None:
+        """Import legacy per-issue JSON state files into the database.
+
+        Runs once per file: imported files are renamed to ``*.json.migrated``.
+        Issues that already have a row are not overwritten, and unreadable
+        files are left in place for inspection.
+        """
+        for issue_number in self._list_json_states():
+            file_path = self._get_state_file_path(issue_number)
+
+            try:
+                payload = file_path.read_bytes()
+                AgentState.model_validate_json(payload)
+
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO states VALUES (?, ?, ?)",
+                    (issue_number, payload, file_path.stat().st_mtime_ns),
+                )
+                file_path.rename(file_path.with_suffix(".json.migrated"))
+                logger.info(f"Migrated state file for issue #{issue_number} into database")
+
+            except (OSError, ValidationError, sqlite3.Error) as e:
+                logger.warning(f"Skipping migration of state file {file_path.name}: {e}")
+
+    def _list_json_states(self) -> list[int]:
+        """List issue numbers that still have legacy JSON state files.
+
+        Returns:
+            Sorted list of issue numbers
+        """
+        issue_numbers = []
+
+        # scandir yields names without stat calls or Path objects per entry
+        with os.scandir(self.state_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("issue-") and name.endswith(".json")):
+                    continue
+
+                # Extract issue number from filename
+                issue_num_str = name[6:-5]
+                if issue_num_str.isdigit():
+                    issue_numbers.append(int(issue_num_str))
+                else:
+                    logger.warning(f"Invalid state filename: {name}")
+
+        issue_numbers.sort()
+        return issue_numbers
+
     def _get_state_file_path(self, issue_number: int) -> Path:
-        """Get path to state file for given issue number.
+        """Get path to legacy JSON state file for given issue number.
 
         Args:
             issue_number: GitHub issue number
@@ -49,28 +204,99 @@ class StateManager:
         """
         return self.state_dir / f"issue-{issue_number}.json"
 
-    def save_state(self, state: AgentState) -> None:
-        """Save agent state to JSON file.
+    def _get_review_archive_path(self, issue_number: int) -> Path:
+        """Get path to the archive of older reviews for given issue number.
+
+        Args:
+            issue_number: GitHub issue number
+
+        Returns:
+            Path to append-only JSON Lines review archive
+        """
+        return self.state_dir / f"issue-{issue_number}.reviews.jsonl"
+
+    def _spill_review_history(self, state: AgentState) -> None:
+        """Move all but the newest reviews from state into the review archive.
 
-        Updates the updated_at timestamp automatically before saving.
+        Keeps the saved state bounded in size; detect_stuck_loop only looks
+        at the last STUCK_CHECK_WINDOW reviews, which always stay inline.
+
+        Args:
+            state: AgentState whose review_history is truncated in place
+        """
+        overflow = len(state.review_history) - self.MAX_INLINE_REVIEWS
+        if overflow <= 0:
+            return
+
+        archive_path = self._get_review_archive_path(state.issue_number)
+        lines = "".join(
+            json.dumps(review, default=str) + "\n" for review in state.review_history[:overflow]
+        )
+        with archive_path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+        state.review_history = state.review_history[overflow:]
+        logger.debug(
+            f"Archived {overflow} older reviews for issue #{state.issue_number} "
+            f"to {archive_path.name}"
+        )
+
+    def _now(self) -> datetime:
+        """Get the current UTC time for stamping saves.
+
+        The value is reused for STAMP_RESOLUTION_SECONDS, so bursts of saves
+        within one workflow step don't each build a new datetime.
+
+        Returns:
+            Timezone-aware UTC datetime
+        """
+        mono = time.monotonic()
+        expired = mono - self._last_stamp_mono >= self.STAMP_RESOLUTION_SECONDS
+        if self._last_stamp is None or expired:
+            self._last_stamp = datetime.now(timezone.utc)
+            self._last_stamp_mono = mono
+        return self._last_stamp
+
+    def save_state(self, state: AgentState, stamp: bool = True) -> None:
+        """Save agent state to the state database.
+
+        Updates the updated_at timestamp (at one-second resolution) before
+        saving unless stamp is False. Reviews beyond the newest
+        MAX_INLINE_REVIEWS are appended to the issue's review archive and
+        dropped from state.review_history.
+
+        The state is serialized immediately and handed to the writer thread,
+        so this returns without waiting for disk I/O; load_state sees the new
+        state right away. Call flush() to wait until it is on disk.
 
         Args:
             state: AgentState to save
+            stamp: Whether to refresh state.updated_at; pass False for
+                intermediate saves within one workflow step
 
         Raises:
-            IOError: If file write fails
+            RuntimeError: If the state manager has been closed
         """
         try:
-            # Update timestamp
-            state.updated_at = datetime.utcnow()
+            # Check before touching state or the review archive
+            if not self._writer.is_alive():
+                raise RuntimeError("StateManager is closed")
+
+            if stamp:
+                state.updated_at = self._now()
 
-            file_path = self._get_state_file_path(state.issue_number)
+            self._spill_review_history(state)
 
-            # Convert to dict and handle datetime serialization
-            state_dict = state.model_dump(mode="json")
+            # Serialize straight to JSON bytes (datetimes handled by pydantic)
+            payload = self._encode_payload(state.model_dump_json().encode("utf-8"))
+            version = time.time_ns()
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(state_dict, f, indent=2, ensure_ascii=False)
+            with self._pending_lock:
+                self._pending[state.issue_number] = (version, payload)
+            self._write_queue.put((state.issue_number, version, payload))
+
+            # Keep a private copy so later mutations of `state` don't leak into the cache
+            self._cache[state.issue_number] = (version, state.model_copy(deep=True))
 
             logger.info(
                 f"Saved state for issue #{state.issue_number} "
@@ -81,30 +307,120 @@ class StateManager:
             logger.error(f"Failed to save state for issue #{state.issue_number}: {e}")
             raise
 
-    def load_state(self, issue_number: int) -> Optional[AgentState]:
-        """Load agent state from JSON file.
+    def _encode_payload(self, payload: bytes) -> bytes:
+        """Compress a serialized state for storage if it is large enough to benefit.
+
+        Args:
+            payload: State JSON bytes
+
+        Returns:
+            zlib-compressed bytes, or the JSON unchanged for small payloads
+        """
+        if len(payload) < self.COMPRESS_MIN_BYTES:
+            return payload
+        return zlib.compress(payload, self.COMPRESSION_LEVEL)
+
+    @staticmethod
+    def _decode_payload(data: bytes) -> bytes:
+        """Undo _encode_payload.
+
+        Plain JSON (small or migrated states) always starts with "{", which
+        is never the first byte of a zlib stream.
+
+        Args:
+            data: Stored payload
+
+        Returns:
+            State JSON bytes
+        """
+        if data[:1] == b"{":
+            return data
+        return zlib.decompress(data)
+
+    @staticmethod
+    def _construct_trusted(data: bytes) -> AgentState:
+        """Build AgentState from JSON this class wrote itself, skipping validation.
+
+        Only the datetime fields are converted back from their ISO strings so
+        the result behaves like a validated instance.
+
+        Args:
+            data: JSON payload produced by save_state
+
+        Returns:
+            Unvalidated AgentState
+        """
+        fields = json.loads(data)
+        for key in ("started_at", "updated_at", "completed_at"):
+            value = fields.get(key)
+            if isinstance(value, str):
+                fields[key] = datetime.fromisoformat(value)
+        return AgentState.model_construct(**fields)
+
+    def load_state(self, issue_number: int, trust_source: bool = False) -> Optional[AgentState]:
+        """Load agent state from the state database.
+
+        Parsed states are cached per issue and reused while the row's
+        updated_at version is unchanged; callers always get their own copy.
 
         Args:
             issue_number: GitHub issue number
+            trust_source: Skip Pydantic validation because the row was written
+                by this program (e.g. the load inside update_state)
 
         Returns:
-            AgentState if file exists, None otherwise
+            AgentState if a row exists, None otherwise
 
         Raises:
-            ValueError: If JSON is invalid or doesn't match AgentState schema
+            ValueError: If stored JSON is invalid or doesn't match AgentState schema
         """
         try:
-            file_path = self._get_state_file_path(issue_number)
-
-            if not file_path.exists():
-                logger.debug(f"No state file found for issue #{issue_number}")
-                return None
+            # A save that hasn't reached the database yet is the newest state
+            with self._pending_lock:
+                pending = self._pending.get(issue_number)
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                state_dict = json.load(f)
+            if pending is not None:
+                version, data = pending
+            else:
+                row = self.conn.execute(
+                    "SELECT updated_at FROM states WHERE issue_number = ?", (issue_number,)
+                ).fetchone()
+
+                if row is None:
+                    self._cache.pop(issue_number, None)
+                    logger.debug(f"No saved state found for issue #{issue_number}")
+                    return None
+                version, data = row[0], None
+
+            # Reuse the parsed state while the row is unchanged
+            cached = self._cache.get(issue_number)
+            if cached is not None and cached[0] == version:
+                logger.debug(f"Loaded state for issue #{issue_number} from cache")
+                return cached[1].model_copy(deep=True)
+
+            if data is None:
+                row = self.conn.execute(
+                    "SELECT data, updated_at FROM states WHERE issue_number = ?",
+                    (issue_number,),
+                ).fetchone()
+                if row is None:
+                    logger.debug(f"Saved state for issue #{issue_number} was just deleted")
+                    return None
+                data, version = row
+
+            data = self._decode_payload(data)
+            state = None
+            if trust_source:
+                try:
+                    state = self._construct_trusted(data)
+                except (ValueError, TypeError) as e:
+                    # e.g. a row imported from an older JSON file; validate it instead
+                    logger.debug(f"Trusted load failed for issue #{issue_number}: {e}")
 
-            # Parse with Pydantic model
-            state = AgentState(**state_dict)
+            if state is None:
+                # Parse and validate with Pydantic model in one pass
+                state = AgentState.model_validate_json(data)
+            self._cache[issue_number] = (version, state.model_copy(deep=True))
 
             logger.info(
                 f"Loaded state for issue #{issue_number} "
@@ -112,23 +428,79 @@ class StateManager:
             )
             return state
 
-        except FileNotFoundError:
-            logger.debug(f"State file not found for issue #{issue_number}")
-            return None
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in state file for issue #{issue_number}: {e}")
+        except (ValidationError, json.JSONDecodeError, zlib.error) as e:
+            logger.error(f"Invalid JSON in saved state for issue #{issue_number}: {e}")
             raise ValueError(f"Corrupted state file: {e}") from e
 
         except Exception as e:
             logger.error(f"Failed to load state for issue #{issue_number}: {e}")
             raise
 
+    @contextmanager
+    def batch_update(self, issue_number: int) -> Iterator[AgentState]:
+        """Load state once, let the caller modify it, and save it once on exit.
+
+        Use this instead of several consecutive update_state calls::
+
+            with state_manager.batch_update(issue_number) as state:
+                state.iteration += 1
+                state.status = "in_progress"
+
+        If no state exists, a new one is created. Nothing is saved if the
+        block raises.
+
+        Args:
+            issue_number: GitHub issue number
+
+        Yields:
+            AgentState to modify in place
+        """
+        # The row was written by save_state, so validating it again is wasted work
+        state = self.load_state(issue_number, trust_source=True)
+
+        if state is None:
+            logger.info(f"Creating new state for issue #{issue_number}")
+            state = AgentState(issue_number=issue_number)
+
+        yield state
+
+        self.save_state(state)
+
+    def load_all_states(self) -> list[AgentState]:
+        """Load every saved state, ordered by issue number.
+
+        The stored payloads are joined into one JSON array and validated in a
+        single pass instead of one model construction per row.
+
+        Returns:
+            List of AgentState, empty if none are saved
+
+        Raises:
+            ValueError: If any stored JSON is invalid or doesn't match AgentState schema
+        """
+        try:
+            # Include saves still queued for the writer thread
+            self.flush()
+            rows = self.conn.execute("SELECT data FROM states ORDER BY issue_number")
+            payloads = [self._decode_payload(data) for (data,) in rows]
+
+            states = _STATES_ADAPTER.validate_json(b"[" + b",".join(payloads) + b"]")
+            logger.debug(f"Loaded {len(states)} saved states")
+            return states
+
+        except (ValidationError, zlib.error) as e:
+            logger.error(f"Invalid JSON in saved states: {e}")
+            raise ValueError(f"Corrupted state file: {e}") from e
+
+        except Exception as e:
+            logger.error(f"Failed to load states: {e}")
+            raise
+
     def update_state(self, issue_number: int, **updates) -> AgentState:
         """Update specific fields in agent state.
 
-        Loads existing state, applies updates, and saves back to file.
-        If no state exists, creates a new one.
+        Loads existing state, applies updates, and saves it back in a single
+        batch_update. If no state exists, creates a new one.
 
         Args:
             issue_number: GitHub issue number
@@ -141,23 +513,16 @@ class StateManager:
             ValueError: If updates contain invalid fields
         """
         try:
-            # Load existing state or create new one
-            state = self.load_state(issue_number)
+            # Reject unknown fields up front, before touching stored state
+            invalid = updates.keys() - self._ALLOWED_FIELDS
+            if invalid:
+                raise ValueError(f"Invalid field for AgentState: {', '.join(sorted(invalid))}")
 
-            if state is None:
-                logger.info(f"Creating new state for issue #{issue_number}")
-                state = AgentState(issue_number=issue_number)
-
-            # Apply updates
-            for key, value in updates.items():
-                if not hasattr(state, key):
-                    raise ValueError(f"Invalid field for AgentState: {key}")
-
-                setattr(state, key, value)
-                logger.debug(f"Updated field '{key}' for issue #{issue_number}")
-
-            # Save updated state
-            self.save_state(state)
+            with self.batch_update(issue_number) as state:
+                # Apply updates
+                for key, value in updates.items():
+                    setattr(state, key, value)
+                    logger.debug(f"Updated field '{key}' for issue #{issue_number}")
 
             return state
 
@@ -208,12 +573,20 @@ class StateManager:
                 logger.debug("Not enough errors in recent reviews to detect pattern")
                 return False, ""
 
+            n = len(error_summaries)
+
+            # Single sweep over the pairs both checks need: consecutive pairs
+            # (i, i+1) and anchor pairs (0, k). (0, 1) is shared and computed once.
+            pairs = {(i, i + 1) for i in range(n - 1)} | {(0, k) for k in range(1, n)}
+            sims = {
+                (i, j): self._pair_similarity(error_summaries[i], error_summaries[j])
+                for i, j in sorted(pairs)
+            }
+
             # Check similarity between consecutive error summaries
             similar_pairs = []
-            for i in range(len(error_summaries) - 1):
-                similarity = self._calculate_similarity(
-                    error_summaries[i], error_summaries[i + 1]
-                )
+            for i in range(n - 1):
+                similarity = sims[i, i + 1]
 
                 if similarity >= self.SIMILARITY_THRESHOLD:
                     similar_pairs.append((i, i + 1, similarity))
@@ -235,10 +608,7 @@ class StateManager:
 
             # Check if same errors appear in all recent reviews
             if len(error_summaries) == self.STUCK_CHECK_WINDOW:
-                avg_similarity = sum(
-                    self._calculate_similarity(error_summaries[0], err)
-                    for err in error_summaries[1:]
-                ) / (len(error_summaries) - 1)
+                avg_similarity = sum(sims[0, k] for k in range(1, n)) / (n - 1)
 
                 if avg_similarity >= self.SIMILARITY_THRESHOLD:
                     reason = (
@@ -261,46 +631,100 @@ class StateManager:
             # On error, fail safe by not marking as stuck
             return False, ""
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity ratio between two text strings.
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _shingles(text: str) -> frozenset[tuple[str, ...]]:
+        """Split an error summary into its set of lowercase word shingles.
+
+        Results are cached by summary text, so the overlapping review windows
+        of successive iterations aren't re-shingled.
+
+        Args:
+            text: Raw error summary
+
+        Returns:
+            Set of SHINGLE_SIZE-word tuples (a single shorter tuple for
+            summaries with fewer words)
+        """
+        words = text.lower().split()
+        size = StateManager.SHINGLE_SIZE
+        if len(words) < size:
+            return frozenset([tuple(words)]) if words else frozenset()
+        return frozenset(zip(*(words[i:] for i in range(size))))
+
+    def _pair_similarity(self, summary1: str, summary2: str) -> float:
+        """Get the similarity of two error summaries, reusing earlier results.
 
-        Uses difflib's SequenceMatcher for simple string similarity.
+        Successive iterations check overlapping review windows, so most pairs
+        were already compared on a previous call.
 
         Args:
-            text1: First text string
-            text2: Second text string
+            summary1: First error summary
+            summary2: Second error summary
 
         Returns:
             Similarity ratio between 0.0 and 1.0
         """
-        if not text1 or not text2:
-            return 0.0
+        key = (summary1, summary2)
+        similarity = self._sim_cache.get(key)
+        if similarity is not None:
+            self._sim_cache.move_to_end(key)
+            return similarity
+
+        similarity = self._calculate_similarity(
+            self._shingles(summary1), self._shingles(summary2)
+        )
+        self._sim_cache[key] = similarity
+        if len(self._sim_cache) > self.SIMILARITY_CACHE_SIZE:
+            self._sim_cache.popitem(last=False)
+        return similarity
+
+    def _calculate_similarity(
+        self, tokens1: frozenset[tuple[str, ...]], tokens2: frozenset[tuple[str, ...]]
+    ) -> float:
+        """Calculate Jaccard similarity between two shingle sets.
+
+        Linear in the number of words, unlike a character-level diff, and
+        largely insensitive to the order in which issues are listed.
 
-        # Normalize whitespace for better comparison
-        text1_normalized = " ".join(text1.split()).lower()
-        text2_normalized = " ".join(text2.split()).lower()
+        Args:
+            tokens1: First shingle set (see _shingles)
+            tokens2: Second shingle set (see _shingles)
 
-        matcher = SequenceMatcher(None, text1_normalized, text2_normalized)
-        return matcher.ratio()
+        Returns:
+            Similarity ratio between 0.0 and 1.0
+        """
+        if not tokens1 or not tokens2:
+            return 0.0
+
+        intersection = len(tokens1 & tokens2)
+        return intersection / (len(tokens1) + len(tokens2) - intersection)
 
     def delete_state(self, issue_number: int) -> bool:
-        """Delete state file for given issue.
+        """Delete saved state for given issue.
 
         Args:
             issue_number: GitHub issue number
 
         Returns:
-            True if file was deleted, False if it didn't exist
+            True if state was deleted, False if it didn't exist
         """
         try:
-            file_path = self._get_state_file_path(issue_number)
+            # Let queued saves land first so they can't resurrect the row
+            self.flush()
+            self._cache.pop(issue_number, None)
+            with self._pending_lock:
+                self._pending.pop(issue_number, None)
+            cursor = self.conn.execute(
+                "DELETE FROM states WHERE issue_number = ?", (issue_number,)
+            )
+            self._get_review_archive_path(issue_number).unlink(missing_ok=True)
 
-            if file_path.exists():
-                file_path.unlink()
-                logger.info(f"Deleted state file for issue #{issue_number}")
+            if cursor.rowcount > 0:
+                logger.info(f"Deleted saved state for issue #{issue_number}")
                 return True
             else:
-                logger.debug(f"No state file to delete for issue #{issue_number}")
+                logger.debug(f"No saved state to delete for issue #{issue_number}")
                 return False
 
         except Exception as e:
@@ -314,22 +738,51 @@ class StateManager:
             List of issue numbers with saved states
         """
         try:
-            issue_numbers = []
+            rows = self.conn.execute("SELECT issue_number FROM states")
+            with self._pending_lock:
+                pending = set(self._pending)
+            issue_numbers = sorted(pending.union(issue_number for (issue_number,) in rows))
 
-            for file_path in self.state_dir.glob("issue-*.json"):
-                # Extract issue number from filename
-                try:
-                    issue_num_str = file_path.stem.replace("issue-", "")
-                    issue_number = int(issue_num_str)
-                    issue_numbers.append(issue_number)
-                except ValueError:
-                    logger.warning(f"Invalid state filename: {file_path.name}")
-                    continue
-
-            issue_numbers.sort()
             logger.debug(f"Found {len(issue_numbers)} saved states")
             return issue_numbers
 
         except Exception as e:
             logger.error(f"Failed to list states: {e}")
             raise
+
+    def flush(self) -> None:
+        """Block until all queued saves have been written to the database.
+
+        Raises:
+            RuntimeError: If any save failed to write since the last flush
+        """
+        self._write_queue.join()
+        self._raise_write_errors()
+
+    def close(self) -> None:
+        """Write pending saves, stop the writer thread and close the database.
+
+        Safe to call more than once; also runs automatically at interpreter exit.
+
+        Raises:
+            RuntimeError: If any save failed to write since the last flush
+        """
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+        self.conn.close()
+        atexit.unregister(self.close)
+        self._raise_write_errors()
+
+    def _raise_write_errors(self) -> None:
+        """Raise (once) for saves the writer thread failed to write.
+
+        Raises:
+            RuntimeError: If any write errors were recorded
+        """
+        with self._pending_lock:
+            errors, self._write_errors = self._write_errors, []
+
+        if errors:
+            issues = ", ".join(f"#{issue_number}" for issue_number, _ in errors)
+            raise RuntimeError(f"Failed to write state for issue(s) {issues}") from errors[0][1]
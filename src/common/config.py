@@ -3,27 +3,50 @@
 import os
 import re
 import logging
+from functools import lru_cache
 from typing import Optional, Literal
 from pydantic import SecretStr, field_validator, model_validator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Possessive quantifiers: matching is linear, with no backtracking on bad input
+_REPO_RE = re.compile(r"[a-zA-Z0-9_.-]++/[a-zA-Z0-9_.-]++")
+_REPO_PUNCTUATION = str.maketrans("", "", "._-")
+
 
 class SecretFilter(logging.Filter):
     """Filter to redact secrets from log messages."""
 
+    # Common secret patterns fused into one alternation, so each message is
+    # scanned once; the matching group name selects the replacement
+    _PATTERN = re.compile(
+        r"(?P<github>ghp_[a-zA-Z0-9]{36,})"
+        r"|(?P<openai>sk-[a-zA-Z0-9]{48,})"
+        r"|(?P<bearer>Bearer\s+[a-zA-Z0-9\-._~+/]+=*)"
+    )
+    _REPLACEMENTS = {
+        "github": "[GITHUB_TOKEN_REDACTED]",
+        "openai": "[OPENAI_KEY_REDACTED]",
+        "bearer": "Bearer [TOKEN_REDACTED]",
+    }
+    # Every pattern starts with one of these literals
+    _MARKERS = ("ghp_", "sk-", "Bearer")
+
     def filter(self, record: logging.LogRecord) -> bool:
         message = record.getMessage()
-        # Redact common secret patterns
-        patterns = [
-            (r"ghp_[a-zA-Z0-9]{36,}", "[GITHUB_TOKEN_REDACTED]"),
-            (r"sk-[a-zA-Z0-9]{48,}", "[OPENAI_KEY_REDACTED]"),
-            (r"Bearer\s+[a-zA-Z0-9\-._~+/]+=*", "Bearer [TOKEN_REDACTED]"),
-        ]
-        for pattern, replacement in patterns:
-            message = re.sub(pattern, replacement, message)
-        record.msg = message
+
+        # Most log lines contain no secret at all; skip the regex for them
+        if not any(marker in message for marker in self._MARKERS):
+            return True
+
+        record.msg = self._PATTERN.sub(self._redact, message)
+        record.args = ()  # message is already formatted
         return True
 
+    @classmethod
+    def _redact(cls, match: re.Match) -> str:
+        """Get the replacement for whichever secret pattern matched."""
+        return cls._REPLACEMENTS[match.lastgroup]
+
 
 class AgentConfig(BaseSettings):
     """Main configuration for the SDLC agent system."""
@@ -43,6 +66,10 @@ class AgentConfig(BaseSettings):
     llm_provider: Literal["openai", "yandex"] = Field(
         default="openai", description="LLM provider to use"
     )
+    llm_warm_up: bool = Field(
+        default=False,
+        description="Open the LLM connection in the background when the client is created",
+    )
 
     # OpenAI Configuration
     openai_api_key: Optional[SecretStr] = Field(
@@ -93,6 +120,12 @@ class AgentConfig(BaseSettings):
         default=5000, description="Max GitHub API requests per hour", ge=100
     )
 
+    # Caching
+    llm_cache_enabled: bool = Field(
+        default=False,
+        description="Persist LLM outputs under .agent-state/ so later runs can reuse them",
+    )
+
     @field_validator("llm_provider", mode="after")
     @classmethod
     def validate_llm_provider(cls, v: str) -> str:
@@ -114,7 +147,14 @@ class AgentConfig(BaseSettings):
     @classmethod
     def validate_github_repository(cls, v: str) -> str:
         """Validate GitHub repository format."""
-        if not re.match(r"^[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+$", v):
+        # Fast path: exactly one "/" between two non-empty ASCII name parts
+        owner, sep, repo = v.partition("/")
+        if sep and owner and repo:
+            stripped = (owner + repo).translate(_REPO_PUNCTUATION)
+            if not stripped or (stripped.isascii() and stripped.isalnum()):
+                return v
+
+        if not _REPO_RE.fullmatch(v):
             raise ValueError(
                 "github_repository must be in format 'owner/repo'"
             )
@@ -174,8 +214,24 @@ def setup_logging(config: AgentConfig) -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
+_LOGGING_READY = False
+
+
+def _setup_logging_once(config: AgentConfig) -> None:
+    """Configure logging on the first call only."""
+    global _LOGGING_READY
+    if not _LOGGING_READY:
+        setup_logging(config)
+        _LOGGING_READY = True
+
+
+@lru_cache(maxsize=1)
 def load_config() -> AgentConfig:
-    """Load and validate configuration from environment."""
+    """Load and validate configuration from environment.
+
+    The result is cached for the process; call load_config.cache_clear() to
+    re-read the environment (e.g. in tests).
+    """
     config = AgentConfig()
-    setup_logging(config)
+    _setup_logging_once(config)
     return config
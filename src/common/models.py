@@ -1,18 +1,51 @@
 """Pydantic models for data structures used throughout the system."""
 
-from typing import Optional, List, Dict, Any, Literal
-from datetime import datetime
-from pydantic import BaseModel, Field
+import sys
+from functools import partial
+from typing import Optional, List, Dict, Any, Literal, NamedTuple
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Timezone-aware replacement for the deprecated datetime.utcnow()
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 class IssueLabel(BaseModel):
     """GitHub issue/PR label."""
 
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    color: str = ""
+    description: str = ""
+
+    @field_validator("name", "color", mode="after")
+    @classmethod
+    def intern_repeated(cls, v: str) -> str:
+        """Share one string object per distinct label name/color across all labels."""
+        return sys.intern(v)
+
+
+class IssueLabelTuple(NamedTuple):
+    """Compact label stored on Issue/PullRequest (IssueLabel is the API-facing model)."""
+
     name: str
     color: str = ""
     description: str = ""
 
 
+def _compact_labels(labels: Any) -> Any:
+    """Convert IssueLabel models to IssueLabelTuple; other inputs are validated as-is."""
+    if not isinstance(labels, list):
+        return labels
+    return [
+        IssueLabelTuple(label.name, label.color, label.description)
+        if isinstance(label, IssueLabel)
+        else label
+        for label in labels
+    ]
+
+
 class IssueRequirement(BaseModel):
     """A single requirement extracted from an issue."""
 
@@ -28,7 +61,7 @@ class Issue(BaseModel):
     title: str
     body: str
     state: Literal["open", "closed"]
-    labels: List[IssueLabel] = Field(default_factory=list)
+    labels: List[IssueLabelTuple] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
     user: str
@@ -41,6 +74,12 @@ class Issue(BaseModel):
     target_files: List[str] = Field(default_factory=list)
     complexity: Optional[Literal["simple", "medium", "complex"]] = None
 
+    @field_validator("labels", mode="before")
+    @classmethod
+    def compact_labels(cls, v: Any) -> Any:
+        """Store labels as compact tuples."""
+        return _compact_labels(v)
+
 
 class PullRequest(BaseModel):
     """GitHub pull request representation."""
@@ -51,7 +90,8 @@ class PullRequest(BaseModel):
     state: Literal["open", "closed", "merged"]
     head_branch: str
     base_branch: str
-    labels: List[IssueLabel] = Field(default_factory=list)
+    head_sha: Optional[str] = None
+    labels: List[IssueLabelTuple] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
     html_url: str
@@ -60,10 +100,18 @@ class PullRequest(BaseModel):
     # Associated issue
     issue_number: Optional[int] = None
 
+    @field_validator("labels", mode="before")
+    @classmethod
+    def compact_labels(cls, v: Any) -> Any:
+        """Store labels as compact tuples."""
+        return _compact_labels(v)
+
 
 class FileChange(BaseModel):
     """Represents a change to a file."""
 
+    model_config = ConfigDict(frozen=True)
+
     path: str
     change_type: Literal["added", "modified", "deleted"]
     additions: int = 0
@@ -110,6 +158,8 @@ class RequirementAnalysis(BaseModel):
 class CIResult(BaseModel):
     """Results from a CI check."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     status: Literal["success", "failure", "pending", "unknown"]
     conclusion: Optional[Literal["success", "failure", "neutral", "cancelled", "timed_out"]] = (
@@ -121,6 +171,8 @@ class CIResult(BaseModel):
 class SecurityIssue(BaseModel):
     """Security issue detected by analysis."""
 
+    model_config = ConfigDict(frozen=True)
+
     severity: Literal["HIGH", "MEDIUM", "LOW"]
     confidence: Literal["HIGH", "MEDIUM", "LOW"]
     test_id: str
@@ -134,6 +186,8 @@ class SecurityIssue(BaseModel):
 class LintError(BaseModel):
     """Linting error."""
 
+    model_config = ConfigDict(frozen=True)
+
     file: str
     line: int
     column: int = 0
@@ -145,6 +199,8 @@ class LintError(BaseModel):
 class TestFailure(BaseModel):
     """Test failure information."""
 
+    model_config = ConfigDict(frozen=True)
+
     test_name: str
     file: str
     line: Optional[int] = None
@@ -155,6 +211,8 @@ class TestFailure(BaseModel):
 class ReviewComment(BaseModel):
     """Inline review comment on a PR."""
 
+    model_config = ConfigDict(frozen=True)
+
     path: str
     position: Optional[int] = None  # Position in diff
     line: Optional[int] = None  # Absolute line number
@@ -162,6 +220,15 @@ class ReviewComment(BaseModel):
     severity: Literal["blocking", "non-blocking", "suggestion"] = "non-blocking"
 
 
+class DiffAnalysis(BaseModel):
+    """LLM assessment of a PR diff."""
+
+    summary: str
+    changes_made: List[str] = Field(default_factory=list)
+    potential_issues: List[str] = Field(default_factory=list)
+    quality_assessment: str
+
+
 class ReviewOutput(BaseModel):
     """Structured output for code review."""
 
@@ -178,7 +245,7 @@ class ReviewOutput(BaseModel):
 
     # Metadata
     iteration: int = 1
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class AgentState(BaseModel):
@@ -195,8 +262,8 @@ class AgentState(BaseModel):
     review_history: List[Dict[str, Any]] = Field(default_factory=list)
 
     # Timestamps
-    started_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
 
     # Metadata
@@ -1,17 +1,54 @@
 """Analysis engine for PR diff analysis and comment generation."""
 
+import asyncio
 import logging
+import os
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from collections.abc import Callable
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fall back to per-term substring checks
+    ahocorasick = None
 
-from src.common.models import ReviewComment
+from src.common.models import DiffAnalysis, ReviewComment
 from src.common.config import AgentConfig
 from src.code_agent.llm_client import call_llm_text
+from src.code_agent.prompt_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Sections of the diff analysis response
+_RE_SECTION = re.compile(r"(SUMMARY|CHANGES|ISSUES|QUALITY):\s*")
+
+# Key term extraction from requirements
+_RE_TOKEN = re.compile(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b")
+_COMMON_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "that", "this", "should", "must", "will",
+})
+
+# Hunk header with new-file start and optional count
+_RE_HUNK = re.compile(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# Diff size limits: characters sent to the LLM, and characters looked at at all
+PROMPT_DIFF_CHARS = 8000
+MAX_DIFF_CHARS = 1_000_000
 
-def analyze_pr_diff(diff: str, requirements: List[str], config: AgentConfig) -> Dict[str, Any]:
+# On-disk cache of diff analyses, keyed by model and prompt
+# (only with config.llm_cache_enabled)
+DIFF_ANALYSIS_CACHE_TTL_SECONDS = 24 * 3600
+_diff_analysis_cache = ResponseCache(
+    cache_dir=Path(".agent-state") / "diff-analysis", ttl_seconds=DIFF_ANALYSIS_CACHE_TTL_SECONDS
+)
+
+
+def analyze_pr_diff(
+    diff: str, requirements: List[str], config: AgentConfig, use_cache: bool = True
+) -> Dict[str, Any]:
     """Analyze PR diff to understand code changes and quality.
 
     Uses LLM to analyze the diff and provide structured feedback about:
@@ -20,10 +57,15 @@ def analyze_pr_diff(diff: str, requirements: List[str], config: AgentConfig) ->
     - Potential bugs
     - Best practice violations
 
+    With config.llm_cache_enabled, successful analyses are cached under
+    .agent-state/diff-analysis/ for a day, so re-running the pipeline on an
+    unchanged PR skips the LLM call.
+
     Args:
         diff: Unified diff string from PR
         requirements: List of requirements from the original issue
         config: Agent configuration for LLM access
+        use_cache: Whether to use the on-disk analysis cache (if enabled in config)
 
     Returns:
         Dictionary with analysis results:
@@ -33,25 +75,95 @@ def analyze_pr_diff(diff: str, requirements: List[str], config: AgentConfig) ->
             "potential_issues": List[str],
             "quality_assessment": str,
         }
+        If the LLM call fails, the result also has "analysis_failed": True.
     """
+    if len(diff) > MAX_DIFF_CHARS:
+        diff = diff[:MAX_DIFF_CHARS]
+
     if not diff or not diff.strip():
         logger.warning("Empty diff provided for analysis")
-        return {
-            "summary": "No changes detected",
-            "changes_made": [],
-            "potential_issues": ["No code changes found in PR"],
-            "quality_assessment": "Cannot assess - no changes",
-        }
+        return _empty_diff_analysis()
+
+    prompt = _build_diff_analysis_prompt(diff, requirements)
+    cache_key = None
+    if use_cache and config.llm_cache_enabled:
+        cache_key = _diff_analysis_cache_key(prompt, config)
+        cached = _diff_analysis_cache.get(cache_key, DiffAnalysis)
+        if cached is not None:
+            logger.debug("Using cached diff analysis")
+            return cached.model_dump()
+
+    try:
+        analysis = _finish_diff_analysis(call_llm_text(prompt, config))
+        if cache_key is not None:
+            _diff_analysis_cache.set(cache_key, DiffAnalysis.model_validate(analysis))
+        return analysis
+
+    except Exception as e:
+        logger.error(f"Failed to analyze diff with LLM: {e}")
+        return _failed_diff_analysis(e)
+
 
-    # Build analysis prompt
-    prompt = f"""Analyze this pull request diff and provide a brief assessment.
+async def analyze_pr_diff_async(
+    diff: str, requirements: List[str], config: AgentConfig, use_cache: bool = True
+) -> Dict[str, Any]:
+    """Async variant of analyze_pr_diff.
+
+    Runs analyze_pr_diff in a worker thread, so several analyses can be
+    awaited together (see analyze_pr_diffs_batch).
+
+    Args:
+        diff: Unified diff string from PR
+        requirements: List of requirements from the original issue
+        config: Agent configuration for LLM access
+        use_cache: Whether to use the on-disk analysis cache (if enabled in config)
+
+    Returns:
+        Dictionary with analysis results, as for analyze_pr_diff
+    """
+    return await asyncio.to_thread(analyze_pr_diff, diff, requirements, config, use_cache)
+
+
+async def analyze_pr_diffs_batch(
+    items: List[Tuple[str, List[str]]],
+    config: AgentConfig,
+    max_concurrency: int = 5,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """Analyze several PR diffs concurrently.
+
+    Args:
+        items: (diff, requirements) pairs, one per PR
+        config: Agent configuration for LLM access
+        max_concurrency: Maximum number of LLM calls in flight at a time
+        use_cache: Whether to use the on-disk analysis cache (if enabled in config)
+
+    Returns:
+        Analysis results in input order
+
+    Example:
+        >>> results = asyncio.run(analyze_pr_diffs_batch(items, config))
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _analyze(diff: str, requirements: List[str]) -> Dict[str, Any]:
+        async with semaphore:
+            return await analyze_pr_diff_async(diff, requirements, config, use_cache)
+
+    return await asyncio.gather(*(_analyze(diff, reqs) for diff, reqs in items))
+
+
+def _build_diff_analysis_prompt(diff: str, requirements: List[str]) -> str:
+    """Build the LLM prompt for analyze_pr_diff."""
+    diff_for_prompt = diff[:PROMPT_DIFF_CHARS]
+    return f"""Analyze this pull request diff and provide a brief assessment.
 
 Requirements to fulfill:
 {chr(10).join(f"- {req}" for req in requirements)}
 
 Diff:
 ```diff
-{diff[:8000]}  # Limit diff size for token constraints
+{diff_for_prompt}
 ```
 
 Provide a concise analysis covering:
@@ -69,25 +181,42 @@ ISSUES:
 QUALITY: <assessment>
 """
 
-    try:
-        response = call_llm_text(prompt, config)
 
-        # Parse response
-        analysis = _parse_diff_analysis(response)
+def _diff_analysis_cache_key(prompt: str, config: AgentConfig) -> str:
+    """Get the cache key for a diff analysis prompt under the configured model."""
+    model = config.openai_model if config.llm_provider == "openai" else config.yandex_model
+    return ResponseCache.make_key(config.llm_provider, model, DiffAnalysis, prompt)
 
-        logger.info(f"Analyzed diff: {len(analysis['changes_made'])} changes, "
-                   f"{len(analysis['potential_issues'])} potential issues")
 
-        return analysis
+def _finish_diff_analysis(response: str) -> Dict[str, Any]:
+    """Parse and log the LLM response for a diff analysis."""
+    analysis = _parse_diff_analysis(response)
 
-    except Exception as e:
-        logger.error(f"Failed to analyze diff with LLM: {e}")
-        return {
-            "summary": "Analysis failed",
-            "changes_made": ["Unable to analyze changes"],
-            "potential_issues": [f"Analysis error: {str(e)}"],
-            "quality_assessment": "Cannot assess due to analysis failure",
-        }
+    logger.info(f"Analyzed diff: {len(analysis['changes_made'])} changes, "
+               f"{len(analysis['potential_issues'])} potential issues")
+
+    return analysis
+
+
+def _empty_diff_analysis() -> Dict[str, Any]:
+    """Return the analysis result for a PR without changes."""
+    return {
+        "summary": "No changes detected",
+        "changes_made": [],
+        "potential_issues": ["No code changes found in PR"],
+        "quality_assessment": "Cannot assess - no changes",
+    }
+
+
+def _failed_diff_analysis(error: Exception) -> Dict[str, Any]:
+    """Return the analysis result when the LLM call fails."""
+    return {
+        "summary": "Analysis failed",
+        "changes_made": ["Unable to analyze changes"],
+        "potential_issues": [f"Analysis error: {str(error)}"],
+        "quality_assessment": "Cannot assess due to analysis failure",
+        "analysis_failed": True,
+    }
 
 
 def check_requirements_fulfillment(
@@ -116,19 +245,28 @@ def check_requirements_fulfillment(
 
     fulfillment = {}
 
-    for req in requirements:
+    # Lowercase the diff, file paths and file stems once rather than per requirement and term
+    diff_lower = diff.lower()
+    file_names = [
+        (file_path.lower(), os.path.splitext(os.path.basename(file_path.rstrip("/")))[0].lower())
+        for file_path in files_changed
+    ]
+
+    # Find which requirements have a key term in the diff, in a single scan when possible
+    term_sets = [{term.lower() for term in _extract_key_terms(req)} for req in requirements]
+    reqs_in_diff = _match_term_sets(diff_lower, term_sets)
+
+    for index, req in enumerate(requirements):
         # Extract potential file names or keywords from requirement
         req_lower = req.lower()
 
         # Check if requirement mentions specific files that were changed
         file_mentioned = any(
-            file_path in req_lower or Path(file_path).stem.lower() in req_lower
-            for file_path in files_changed
+            file_path in req_lower or stem in req_lower for file_path, stem in file_names
         )
 
         # Check if key terms from requirement appear in diff
-        key_terms = _extract_key_terms(req)
-        terms_in_diff = any(term.lower() in diff.lower() for term in key_terms)
+        terms_in_diff = index in reqs_in_diff
 
         # Simple heuristic: fulfilled if either condition is met
         fulfillment[req] = file_mentioned or terms_in_diff
@@ -194,28 +332,22 @@ def generate_line_comments(
     """
     comments = []
 
-    # Process lint errors
-    for lint_error in ci_results.get("lint", []):
-        comment = _create_comment_for_lint(lint_error, diff_data)
-        if comment:
-            comments.append(comment)
+    # Map every new-file line to its diff position once; each failure is then a lookup
+    position_index = _build_position_index(diff_data)
 
-    # Process type errors
-    for type_error in ci_results.get("types", []):
-        comment = _create_comment_for_type(type_error, diff_data)
-        if comment:
-            comments.append(comment)
+    # Tools can report the same issue more than once; post each comment once
+    seen: Set[Tuple[str, Optional[int], str]] = set()
 
-    # Process security issues
-    for security_issue in ci_results.get("security", []):
-        comment = _create_comment_for_security(security_issue, diff_data)
-        if comment:
-            comments.append(comment)
+    for kind in _COMMENT_SPECS:
+        for failure in ci_results.get(kind, []):
+            comment = _build_comment(kind, failure, position_index)
+            if not comment:
+                continue
 
-    # Process test failures (harder to map to specific lines, but try)
-    for test_failure in ci_results.get("tests", []):
-        comment = _create_comment_for_test(test_failure, diff_data)
-        if comment:
+            key = (comment.path, comment.position, comment.body)
+            if key in seen:
+                continue
+            seen.add(key)
             comments.append(comment)
 
     logger.info(f"Generated {len(comments)} inline review comments from CI results")
@@ -225,30 +357,27 @@ def generate_line_comments(
 
 def _parse_diff_analysis(response: str) -> Dict[str, Any]:
     """Parse LLM response for diff analysis."""
-    summary = ""
     changes = []
     issues = []
-    quality = ""
 
-    # Extract sections using regex
-    summary_match = re.search(r"SUMMARY:\s*(.+?)(?=CHANGES:|$)", response, re.DOTALL)
-    if summary_match:
-        summary = summary_match.group(1).strip()
+    # Find all section labels in one pass; each section runs up to the next label
+    sections: Dict[str, str] = {}
+    matches = list(_RE_SECTION.finditer(response))
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(response)
+        sections.setdefault(match.group(1), response[match.end():end].strip())
 
-    changes_match = re.search(r"CHANGES:\s*(.+?)(?=ISSUES:|$)", response, re.DOTALL)
-    if changes_match:
-        changes_text = changes_match.group(1).strip()
-        changes = [line.strip("- ").strip() for line in changes_text.split("\n") if line.strip().startswith("-")]
+    summary = sections.get("SUMMARY", "")
 
-    issues_match = re.search(r"ISSUES:\s*(.+?)(?=QUALITY:|$)", response, re.DOTALL)
-    if issues_match:
-        issues_text = issues_match.group(1).strip()
-        if issues_text.lower() != "none":
-            issues = [line.strip("- ").strip() for line in issues_text.split("\n") if line.strip().startswith("-")]
+    changes_text = sections.get("CHANGES", "")
+    if changes_text:
+        changes = [line.strip("- ").strip() for line in changes_text.splitlines() if line.strip().startswith("-")]
 
-    quality_match = re.search(r"QUALITY:\s*(.+?)$", response, re.DOTALL)
-    if quality_match:
-        quality = quality_match.group(1).strip()
+    issues_text = sections.get("ISSUES", "")
+    if issues_text and issues_text.lower() != "none":
+        issues = [line.strip("- ").strip() for line in issues_text.splitlines() if line.strip().startswith("-")]
+
+    quality = sections.get("QUALITY", "")
 
     return {
         "summary": summary or "No summary provided",
@@ -258,27 +387,58 @@ def _parse_diff_analysis(response: str) -> Dict[str, Any]:
     }
 
 
-def _extract_key_terms(requirement: str) -> List[str]:
-    """Extract key terms from a requirement string.
+def _match_term_sets(text: str, term_sets: List[Set[str]]) -> Set[int]:
+    """Find which term sets have at least one term occurring in text.
+
+    With pyahocorasick installed, all terms go into one automaton and text
+    is scanned once; otherwise each term is checked with a substring search.
 
     Args:
-        requirement: Requirement description
+        text: Text to search (already lowercased)
+        term_sets: Lowercased terms per requirement
 
     Returns:
-        List of key terms (function names, class names, keywords)
+        Indices of term sets with a match
     """
-    # Remove common words and extract potential identifiers
-    common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-                   "of", "with", "by", "from", "that", "this", "should", "must", "will"}
+    if ahocorasick is None:
+        return {i for i, terms in enumerate(term_sets) if any(term in text for term in terms)}
 
-    words = re.findall(r'\b\w+\b', requirement.lower())
-    key_terms = [w for w in words if w not in common_words and len(w) > 3]
+    # term -> indices of the term sets containing it
+    owners: Dict[str, List[int]] = {}
+    for i, terms in enumerate(term_sets):
+        for term in terms:
+            owners.setdefault(term, []).append(i)
 
-    # Also look for snake_case or camelCase identifiers
-    identifiers = re.findall(r'\b[a-z_][a-z0-9_]*\b|\b[A-Z][a-zA-Z0-9]*\b', requirement)
-    key_terms.extend(identifiers)
+    if not owners:
+        return set()
+
+    automaton = ahocorasick.Automaton()
+    for term, indices in owners.items():
+        automaton.add_word(term, indices)
+    automaton.make_automaton()
+
+    matched: Set[int] = set()
+    for _, indices in automaton.iter(text):
+        matched.update(indices)
+        if len(matched) == len(term_sets):
+            break
+    return matched
+
+
+def _extract_key_terms(requirement: str) -> Set[str]:
+    """Extract key terms from a requirement string.
+
+    Args:
+        requirement: Requirement description
 
-    return list(set(key_terms))
+    Returns:
+        Set of key terms (function names, class names, keywords)
+    """
+    # Identifier-like tokens, minus short and common words
+    return {
+        token for token in _RE_TOKEN.findall(requirement)
+        if len(token) > 3 and token.lower() not in _COMMON_WORDS
+    }
 
 
 def _calculate_diff_position(patch: str, line_number: int) -> Optional[int]:
@@ -293,161 +453,158 @@ def _calculate_diff_position(patch: str, line_number: int) -> Optional[int]:
     """
     if not patch:
         return None
+    return _index_patch(patch).get(line_number)
 
-    position = 0
-    current_new_line = 0
 
-    for line in patch.split("\n"):
-        position += 1
+@lru_cache(maxsize=64)
+def _parse_hunks(patch: str) -> Tuple[List[str], List[Tuple[int, int, int, int]]]:
+    """Split a patch into lines and locate its hunks.
 
-        # Skip diff header lines
+    Args:
+        patch: Unified diff patch for a file
+
+    Returns:
+        Tuple of (patch lines, hunks), where each hunk is (new_start, new_end,
+        header line index, end line index) and new_end is exclusive. Hunks
+        without new-file lines are left out.
+    """
+    lines = patch.split("\n")
+    headers = []
+    for i, line in enumerate(lines):
         if line.startswith("@@"):
-            # Parse hunk header to get starting line
-            match = re.search(r'\+(\d+)', line)
+            match = _RE_HUNK.match(line)
             if match:
-                current_new_line = int(match.group(1)) - 1
-            continue
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                headers.append((int(match.group(1)), count, i))
 
-        if line.startswith("-"):
-            # Deleted line, doesn't affect new line count
+    hunks = []
+    for n, (new_start, count, header_index) in enumerate(headers):
+        if count == 0:
             continue
-        elif line.startswith("+"):
-            # Added line
-            current_new_line += 1
-            if current_new_line == line_number:
-                return position
-        else:
-            # Context line
-            current_new_line += 1
-            if current_new_line == line_number:
-                return position
+        end_index = headers[n + 1][2] if n + 1 < len(headers) else len(lines)
+        hunks.append((new_start, new_start + count, header_index, end_index))
 
-    return None
+    return lines, hunks
 
 
-def _create_comment_for_lint(lint_error: Dict[str, Any], diff_data: Dict[str, Any]) -> Optional[ReviewComment]:
-    """Create review comment for lint error."""
-    file_path = lint_error.get("file", "")
-    line = lint_error.get("line", 0)
-
-    if not file_path or not line:
-        return None
-
-    position = find_diff_position(diff_data, file_path, line)
-
-    # Only create comment if the file is part of the PR diff
-    if position is None:
-        return None
+@lru_cache(maxsize=64)
+def _index_patch(patch: str) -> Dict[int, int]:
+    """Map each new-version line number in a patch to its diff position.
 
-    message = (
-        f"**Linting Error ({lint_error.get('code', 'unknown')})**\n\n"
-        f"{lint_error.get('message', 'Linting issue detected')}\n\n"
-        f"Please fix this linting issue."
-    )
+    Each hunk is walked only up to its last new-file line, so trailing text
+    after a hunk (such as the empty string after a final newline) never gets
+    a position. Cached by patch text; callers must not mutate the result.
 
-    return ReviewComment(
-        path=file_path,
-        position=position,
-        line=line if not position else None,
-        body=message,
-        severity="blocking",
-    )
+    Args:
+        patch: Unified diff patch for a file
 
+    Returns:
+        Dictionary of line number -> diff position (1-indexed)
+    """
+    positions: Dict[int, int] = {}
+    lines, hunks = _parse_hunks(patch)
+
+    for new_start, new_end, header_index, end_index in hunks:
+        current_new_line = new_start - 1
+        for position, line in enumerate(lines[header_index + 1 : end_index], header_index + 2):
+            # One slice per line instead of a startswith call per prefix.
+            # Deleted lines and "\ No newline at end of file" markers have no
+            # new-file line number
+            first = line[:1]
+            if first == "-" or first == "\\":
+                continue
+            current_new_line += 1
+            if current_new_line >= new_end:
+                break
+            # The first position seen for a line wins
+            if current_new_line not in positions:
+                positions[current_new_line] = position
 
-def _create_comment_for_type(type_error: Dict[str, Any], diff_data: Dict[str, Any]) -> Optional[ReviewComment]:
-    """Create review comment for type error."""
-    file_path = type_error.get("file", "")
-    line = type_error.get("line", 0)
+    return positions
 
-    if not file_path or not line:
-        return None
 
-    position = find_diff_position(diff_data, file_path, line)
+def _build_position_index(diff_data: Dict[str, Any]) -> Dict[str, Dict[int, int]]:
+    """Index diff positions for every file in the PR diff.
 
-    # Only create comment if the file is part of the PR diff
-    if position is None:
-        return None
-
-    message = (
-        f"**Type Error**\n\n"
-        f"{type_error.get('message', 'Type checking issue detected')}\n\n"
-        f"Please fix this type error."
-    )
+    Args:
+        diff_data: Parsed diff data with file patches
 
-    return ReviewComment(
-        path=file_path,
-        position=position,
-        line=line if not position else None,
-        body=message,
-        severity="blocking",
-    )
+    Returns:
+        Dictionary of file path -> {line number -> diff position}
+    """
+    return {
+        file_path: _index_patch(patch)
+        for file_path, patch in diff_data.get("files", {}).items()
+        if patch
+    }
 
 
-def _create_comment_for_security(security_issue: Dict[str, Any], diff_data: Dict[str, Any]) -> Optional[ReviewComment]:
-    """Create review comment for security issue."""
-    file_path = security_issue.get("file", "")
-    line = security_issue.get("line", 0)
+def _build_comment(
+    kind: str, failure: Dict[str, Any], position_index: Dict[str, Dict[int, int]]
+) -> Optional[ReviewComment]:
+    """Create review comment for a CI failure of the given category."""
+    file_path = failure.get("file", "")
+    line = failure.get("line")
 
+    # Without a file and line we can't create an inline comment
     if not file_path or not line:
         return None
 
-    position = find_diff_position(diff_data, file_path, line)
+    position = position_index.get(file_path, {}).get(line)
 
     # Only create comment if the file is part of the PR diff
     if position is None:
         return None
 
-    severity_level = security_issue.get("severity", "MEDIUM")
-    severity_map = {"HIGH": "blocking", "MEDIUM": "non-blocking", "LOW": "suggestion"}
-
-    message = (
-        f"**Security Issue ({severity_level})**\n\n"
-        f"{security_issue.get('message', 'Security concern detected')}\n\n"
-        f"Please review and address this security concern."
-    )
+    format_body, get_severity = _COMMENT_SPECS[kind]
 
     return ReviewComment(
         path=file_path,
         position=position,
         line=line if not position else None,
-        body=message,
-        severity=severity_map.get(severity_level, "non-blocking"),
+        body=format_body(failure),
+        severity=get_severity(failure),
     )
 
 
-def _create_comment_for_test(test_failure: Dict[str, Any], diff_data: Dict[str, Any]) -> Optional[ReviewComment]:
-    """Create review comment for test failure."""
-    file_path = test_failure.get("file", "")
-    line = test_failure.get("line")
-
-    if not file_path:
-        return None
-
-    # If we don't have a specific line, we can't create an inline comment
-    if not line:
-        return None
-
-    position = find_diff_position(diff_data, file_path, line)
-
-    # Only create comment if the file is part of the PR diff
-    if position is None:
-        return None
-
-    message = (
-        f"**Test Failure**\n\n"
-        f"Test: `{test_failure.get('test_name', 'unknown')}`\n\n"
-        f"{test_failure.get('message', 'Test failed')}\n\n"
-        f"Please fix the failing test or update the implementation."
-    )
-
-    return ReviewComment(
-        path=file_path,
-        position=position,
-        line=line if not position else None,
-        body=message,
-        severity="blocking",
-    )
-
-
-# Import Path for file path operations
-from pathlib import Path
+_SECURITY_SEVERITY = {"HIGH": "blocking", "MEDIUM": "non-blocking", "LOW": "suggestion"}
+
+# CI result category -> (comment body formatter, severity getter), in comment order
+_COMMENT_SPECS: Dict[
+    str, Tuple[Callable[[Dict[str, Any]], str], Callable[[Dict[str, Any]], str]]
+] = {
+    "lint": (
+        lambda e: (
+            f"**Linting Error ({e.get('code', 'unknown')})**\n\n"
+            f"{e.get('message', 'Linting issue detected')}\n\n"
+            f"Please fix this linting issue."
+        ),
+        lambda e: "blocking",
+    ),
+    "types": (
+        lambda e: (
+            f"**Type Error**\n\n"
+            f"{e.get('message', 'Type checking issue detected')}\n\n"
+            f"Please fix this type error."
+        ),
+        lambda e: "blocking",
+    ),
+    "security": (
+        lambda e: (
+            f"**Security Issue ({e.get('severity', 'MEDIUM')})**\n\n"
+            f"{e.get('message', 'Security concern detected')}\n\n"
+            f"Please review and address this security concern."
+        ),
+        lambda e: _SECURITY_SEVERITY.get(e.get("severity", "MEDIUM"), "non-blocking"),
+    ),
+    # Test failures are harder to map to specific lines, but try
+    "tests": (
+        lambda e: (
+            f"**Test Failure**\n\n"
+            f"Test: `{e.get('test_name', 'unknown')}`\n\n"
+            f"{e.get('message', 'Test failed')}\n\n"
+            f"Please fix the failing test or update the implementation."
+        ),
+        lambda e: "blocking",
+    ),
+}
@@ -2,9 +2,16 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    import ijson
+except ImportError:  # optional: fall back to loading the whole pytest report
+    ijson = None
+
 from src.common.models import (
     TestFailure,
     LintError,
@@ -13,6 +20,8 @@ from src.common.models import (
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
 
 def parse_ci_artifacts(artifact_dir: str) -> Dict[str, Any]:
     """Parse CI artifacts from JSON reports.
@@ -44,19 +53,21 @@ def parse_ci_artifacts(artifact_dir: str) -> Dict[str, Any]:
         logger.warning(f"Artifact directory does not exist: {artifact_dir}")
         return _empty_ci_results()
 
-    results = {
-        "pytest": _parse_pytest(artifact_path),
-        "ruff": _parse_ruff(artifact_path),
-        "mypy": _parse_mypy(artifact_path),
-        "bandit": _parse_bandit(artifact_path),
-        "pip_audit": _parse_pip_audit(artifact_path),
-        "coverage": _parse_coverage(artifact_path),
-    }
+    # Reports are independent files; read and decode them concurrently
+    with ThreadPoolExecutor(max_workers=len(_REPORT_PARSERS)) as executor:
+        futures = {
+            name: executor.submit(parser, artifact_path) for name, parser in _REPORT_PARSERS
+        }
+        results = {name: future.result() for name, future in futures.items()}
 
     logger.info(f"Parsed CI artifacts from {artifact_dir}")
     return results
 
 
+# Tools whose failures categorize_failures reports
+_CATEGORIZED_TOOLS = ("pytest", "ruff", "mypy", "bandit", "pip_audit")
+
+
 def categorize_failures(ci_results: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     """Categorize CI failures into test, lint, type, security, and dependency categories.
 
@@ -73,6 +84,11 @@ def categorize_failures(ci_results: Dict[str, Any]) -> Dict[str, List[Dict[str,
             "dependencies": [{"package": str, "vulnerability": str, "severity": str}]
         }
     """
+    # Green builds (the common case) have nothing to categorize
+    if all(ci_results.get(tool, {}).get("status") != "failure" for tool in _CATEGORIZED_TOOLS):
+        logger.debug("No CI failures to categorize")
+        return {"tests": [], "lint": [], "types": [], "security": [], "dependencies": []}
+
     categorized = {
         "tests": [],
         "lint": [],
@@ -157,26 +173,21 @@ def _parse_pytest(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "passed": 0, "failed": 0, "total": 0, "failures": []}
 
     try:
-        with open(pytest_file, "r") as f:
-            data = json.load(f)
+        if ijson is not None:
+            # Stream just the summary and the tests; captured output and
+            # environment metadata in large reports are never materialized
+            with open(pytest_file, "rb") as f:
+                summary = next(ijson.items(f, "summary", use_float=True), {})
+            failures = _collect_pytest_failures(_stream_pytest_tests(pytest_file))
+        else:
+            data = json.loads(pytest_file.read_bytes())
+            summary = data.get("summary", {})
+            failures = _collect_pytest_failures(data.get("tests", []))
 
-        summary = data.get("summary", {})
         passed = summary.get("passed", 0)
         failed = summary.get("failed", 0)
         total = summary.get("total", 0)
 
-        failures = []
-        for test in data.get("tests", []):
-            if test.get("outcome") in ["failed", "error"]:
-                call = test.get("call", {})
-                failures.append({
-                    "test_name": test.get("nodeid", "unknown"),
-                    "file": test.get("nodeid", "").split("::")[0] if "::" in test.get("nodeid", "") else "unknown",
-                    "line": test.get("lineno"),
-                    "message": call.get("longrepr", "Test failed"),
-                    "traceback": call.get("longrepr"),
-                })
-
         status = "success" if failed == 0 else "failure"
 
         return {
@@ -192,6 +203,29 @@ def _parse_pytest(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "passed": 0, "failed": 0, "total": 0, "failures": []}
 
 
+def _stream_pytest_tests(pytest_file: Path) -> Iterator[Dict[str, Any]]:
+    """Yield test entries from a pytest report one at a time using ijson."""
+    with open(pytest_file, "rb") as f:
+        yield from ijson.items(f, "tests.item", use_float=True)
+
+
+def _collect_pytest_failures(tests: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Extract failed and errored tests from pytest report entries."""
+    failures = []
+    for test in tests:
+        if test.get("outcome") in ["failed", "error"]:
+            call = test.get("call", {})
+            failures.append({
+                "test_name": test.get("nodeid", "unknown"),
+                "file": test.get("nodeid", "").split("::")[0] if "::" in test.get("nodeid", "") else "unknown",
+                "line": test.get("lineno"),
+                "message": call.get("longrepr", "Test failed"),
+                "traceback": call.get("longrepr"),
+            })
+
+    return failures
+
+
 def _parse_ruff(artifact_path: Path) -> Dict[str, Any]:
     """Parse ruff JSON report.
 
@@ -204,8 +238,7 @@ def _parse_ruff(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "error_count": 0, "errors": []}
 
     try:
-        with open(ruff_file, "r") as f:
-            content = f.read()
+        content = ruff_file.read_text()
 
         # Skip non-JSON lines from uv output (Building, Uninstalled, etc.)
         # Find the first '[' which marks the beginning of JSON array
@@ -214,7 +247,8 @@ def _parse_ruff(artifact_path: Path) -> Dict[str, Any]:
             logger.debug("No JSON array found in ruff report")
             return {"status": "unknown", "error_count": 0, "errors": []}
 
-        data = json.loads(content[json_start:])
+        # Decode in place from the array start instead of copying the tail
+        data, _ = _JSON_DECODER.raw_decode(content, json_start)
 
         # Ruff outputs a list of violations
         errors = []
@@ -254,17 +288,19 @@ def _parse_mypy(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "error_count": 0, "errors": []}
 
     try:
+        errors = []
         with open(mypy_file, "r") as f:
-            # Mypy outputs one JSON object per line
-            lines = f.readlines()
+            # Mypy outputs one JSON object per line; read them one at a time
+            for raw in f:
+                line = raw.strip()
+                if not line:
+                    continue
 
-        errors = []
-        for line in lines:
-            if not line.strip():
-                continue
+                try:
+                    error = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
 
-            try:
-                error = json.loads(line)
                 errors.append({
                     "file": error.get("file", "unknown"),
                     "line": error.get("line", 0),
@@ -272,8 +308,6 @@ def _parse_mypy(artifact_path: Path) -> Dict[str, Any]:
                     "message": error.get("message", ""),
                     "severity": error.get("severity", "error"),
                 })
-            except json.JSONDecodeError:
-                continue
 
         error_count = len([e for e in errors if e.get("severity") == "error"])
         status = "success" if error_count == 0 else "failure"
@@ -301,8 +335,7 @@ def _parse_bandit(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "issues": []}
 
     try:
-        with open(bandit_file, "r") as f:
-            data = json.load(f)
+        data = json.loads(bandit_file.read_bytes())
 
         issues = []
         for result in data.get("results", []):
@@ -343,8 +376,7 @@ def _parse_pip_audit(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "vulnerabilities": []}
 
     try:
-        with open(pip_audit_file, "r") as f:
-            data = json.load(f)
+        data = json.loads(pip_audit_file.read_bytes())
 
         vulnerabilities = []
         for package in data.get("dependencies", []):
@@ -382,8 +414,7 @@ def _parse_coverage(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "total_percent": 0.0}
 
     try:
-        with open(coverage_file, "r") as f:
-            data = json.load(f)
+        data = json.loads(coverage_file.read_bytes())
 
         totals = data.get("totals", {})
         total_percent = totals.get("percent_covered", 0.0)
@@ -403,6 +434,17 @@ def _parse_coverage(artifact_path: Path) -> Dict[str, Any]:
         return {"status": "unknown", "total_percent": 0.0}
 
 
+# Result key -> report parser, in the order results are reported
+_REPORT_PARSERS = (
+    ("pytest", _parse_pytest),
+    ("ruff", _parse_ruff),
+    ("mypy", _parse_mypy),
+    ("bandit", _parse_bandit),
+    ("pip_audit", _parse_pip_audit),
+    ("coverage", _parse_coverage),
+)
+
+
 def _empty_ci_results() -> Dict[str, Any]:
     """Return empty CI results structure."""
     return {
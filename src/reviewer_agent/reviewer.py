@@ -5,12 +5,14 @@ in GitHub Actions. It analyzes PR changes, CI results, and requirements
 to generate comprehensive code reviews.
 """
 
-import json
+import hashlib
 import logging
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 import click
 
@@ -18,6 +20,7 @@ from src.common.config import AgentConfig, load_config
 from src.common.models import ReviewOutput, ReviewComment, Issue, PullRequest
 from src.code_agent.github_client import GitHubClient
 from src.code_agent.llm_client import call_llm_structured, call_llm_text
+from src.code_agent.prompt_cache import ResponseCache
 from src.reviewer_agent.ci_analyzer import parse_ci_artifacts, categorize_failures
 from src.reviewer_agent.analysis_engine import (
     analyze_pr_diff,
@@ -27,12 +30,28 @@ from src.reviewer_agent.analysis_engine import (
 
 logger = logging.getLogger(__name__)
 
+# PR label carrying the review iteration, e.g. "iteration-2"
+_ITER_RE = re.compile(r"iteration-(\d+)", re.IGNORECASE)
+
+# Per-file header line of a unified git diff
+_DIFF_HEADER_RE = re.compile(r"^diff --git[^\n]*", re.MULTILINE)
+
+# Finished reviews, keyed by PR head commit and CI artifacts, so re-delivered
+# webhooks and re-triggered runs for an unchanged head skip the analysis
+# (only with config.llm_cache_enabled)
+REVIEW_CACHE_TTL_SECONDS = 24 * 3600
+_review_cache = ResponseCache(
+    cache_dir=Path(".agent-state") / "review-cache", ttl_seconds=REVIEW_CACHE_TTL_SECONDS
+)
+
 
 def analyze_pr(
     pr_number: int,
     issue_number: Optional[int],
     artifact_dir: str,
     config: AgentConfig,
+    github_client: Optional[GitHubClient] = None,
+    use_cache: bool = True,
 ) -> ReviewOutput:
     """Analyze a pull request and generate comprehensive review.
 
@@ -48,45 +67,71 @@ def analyze_pr(
         issue_number: Associated issue number (optional)
         artifact_dir: Directory containing CI artifacts
         config: Agent configuration
+        github_client: Client to reuse; if omitted, one is created and closed here
+        use_cache: Whether to use cached reviews and LLM analyses (if enabled in
+            config); False forces a fresh review
 
     Returns:
         ReviewOutput model with complete review data
     """
     logger.info(f"Starting analysis of PR #{pr_number}")
 
-    github_client = GitHubClient(config)
+    owns_client = github_client is None
+    if owns_client:
+        github_client = GitHubClient(config)
 
     try:
         # Fetch PR data
         pr = github_client.fetch_pull_request(pr_number)
         logger.info(f"Analyzing PR: {pr.title}")
 
+        issue_num = issue_number or pr.issue_number
+
+        cache_key = None
+        if use_cache and config.llm_cache_enabled and pr.head_sha:
+            cache_key = _review_cache_key(pr, issue_num, artifact_dir, config)
+            cached = _review_cache.get(cache_key, ReviewOutput)
+            if cached is not None:
+                logger.info(f"Reusing cached review for PR #{pr_number} at {pr.head_sha[:7]}")
+                return cached
+
         # Fetch associated issue if available
         issue = None
+        issue_fetch_failed = False
         requirements = []
         acceptance_criteria = []
 
-        if issue_number or pr.issue_number:
-            issue_num = issue_number or pr.issue_number
-            try:
-                issue = github_client.fetch_issue(issue_num)
-                requirements = issue.requirements
-                acceptance_criteria = issue.acceptance_criteria
-                logger.info(f"Found {len(requirements)} requirements from issue #{issue_num}")
-            except Exception as e:
-                logger.warning(f"Could not fetch issue #{issue_num}: {e}")
-
-        # Get PR diff and files
-        diff = github_client.get_pr_diff(pr_number)
-        files_changed = github_client.get_pr_files_changed(pr_number)
+        # The issue, diff and file list are independent requests; overlap them,
+        # and parse the local CI artifacts while they are in flight
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            diff_future = executor.submit(github_client.get_pr_diff, pr_number)
+            files_future = executor.submit(github_client.get_pr_files_changed, pr_number)
+            issue_future = None
+            if issue_num:
+                issue_future = executor.submit(github_client.fetch_issue, issue_num)
+
+            # Parse CI artifacts
+            ci_results = parse_ci_artifacts(artifact_dir)
+            categorized_failures = categorize_failures(ci_results)
+
+            if issue_future is not None:
+                try:
+                    issue = issue_future.result()
+                    requirements = issue.requirements
+                    acceptance_criteria = issue.acceptance_criteria
+                    logger.info(f"Found {len(requirements)} requirements from issue #{issue_num}")
+                except Exception as e:
+                    issue_fetch_failed = True
+                    logger.warning(f"Could not fetch issue #{issue_num}: {e}")
+
+            # Get PR diff and files
+            diff = diff_future.result()
+            files_changed = files_future.result()
+
         file_paths = [fc.path for fc in files_changed]
 
         logger.info(f"PR has {len(files_changed)} changed files")
 
-        # Parse CI artifacts
-        ci_results = parse_ci_artifacts(artifact_dir)
-        categorized_failures = categorize_failures(ci_results)
-
         logger.info(f"Parsed CI results: {len(categorized_failures.get('tests', []))} test failures, "
                    f"{len(categorized_failures.get('lint', []))} lint errors")
 
@@ -96,7 +141,7 @@ def analyze_pr(
             "files_changed": file_paths,
         }
 
-        diff_analysis = analyze_pr_diff(diff, requirements, config)
+        diff_analysis = analyze_pr_diff(diff, requirements, config, use_cache=use_cache)
 
         # Check requirement fulfillment
         requirements_fulfilled = {}
@@ -133,6 +178,12 @@ def analyze_pr(
                    f"blocking_issues={len(review.blocking_issues)}, "
                    f"line_comments={len(review.line_comments)}")
 
+        # Don't replay a review degraded by a transient failure
+        if cache_key is not None and not (
+            issue_fetch_failed or diff_analysis.get("analysis_failed")
+        ):
+            _review_cache.set(cache_key, review)
+
         return review
 
     except Exception as e:
@@ -151,7 +202,52 @@ def analyze_pr(
         )
 
     finally:
-        github_client.close()
+        if owns_client:
+            github_client.close()
+
+
+def _review_cache_key(
+    pr: PullRequest,
+    issue_number: Optional[int],
+    artifact_dir: str,
+    config: AgentConfig,
+) -> str:
+    """Build the review cache key for a PR head and its CI artifacts.
+
+    Artifacts are fingerprinted by name, size and modification time, so a
+    new CI run for the same commit produces a new key.
+
+    Args:
+        pr: Fetched pull request (head_sha must be set)
+        issue_number: Associated issue number, if any
+        artifact_dir: Directory containing CI artifacts
+        config: Agent configuration
+
+    Returns:
+        Hex digest identifying the review inputs
+    """
+    model = config.openai_model if config.llm_provider == "openai" else config.yandex_model
+    digest = hashlib.blake2b(digest_size=16)
+    parts = [
+        str(pr.number),
+        pr.head_sha or "",
+        str(issue_number or ""),
+        ",".join(sorted(label.name for label in pr.labels)),
+        config.llm_provider,
+        model,
+    ]
+
+    artifact_path = Path(artifact_dir)
+    if artifact_path.is_dir():
+        for entry in sorted(artifact_path.iterdir()):
+            if entry.is_file():
+                stat = entry.stat()
+                parts.append(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}")
+
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 def determine_outcome(
@@ -315,7 +411,7 @@ def generate_review_with_line_comments(
         overall_quality_score=outcome["quality_score"],
         ci_summary=ci_summary,
         iteration=iteration,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
     )
 
 
@@ -323,6 +419,7 @@ def post_review_idempotent(
     pr_number: int,
     review: ReviewOutput,
     config: AgentConfig,
+    github_client: Optional[GitHubClient] = None,
 ) -> None:
     """Post review to GitHub PR in an idempotent way.
 
@@ -335,13 +432,13 @@ def post_review_idempotent(
         pr_number: GitHub PR number
         review: ReviewOutput to post
         config: Agent configuration
+        github_client: Client to reuse; if omitted, one is created and closed here
     """
-    github_client = GitHubClient(config)
+    owns_client = github_client is None
+    if owns_client:
+        github_client = GitHubClient(config)
 
     try:
-        # Dismiss old bot reviews to avoid clutter
-        github_client.dismiss_old_bot_reviews(pr_number)
-
         # Determine review event
         # Note: GitHub Actions bots cannot APPROVE PRs, so we use COMMENT instead
         if review.blocking_issues:
@@ -349,8 +446,8 @@ def post_review_idempotent(
         else:
             event = "COMMENT"
 
-        # Post review
-        github_client.post_review(pr_number, review, event)
+        # Dismiss old bot reviews to avoid clutter and post the new review
+        github_client.dismiss_and_post_review(pr_number, review, event)
 
         # Also post/update summary comment
         summary_text = _format_summary_comment(review)
@@ -363,7 +460,8 @@ def post_review_idempotent(
         raise
 
     finally:
-        github_client.close()
+        if owns_client:
+            github_client.close()
 
 
 def _parse_diff_to_dict(diff: str, file_paths: List[str]) -> Dict[str, Any]:
@@ -378,27 +476,14 @@ def _parse_diff_to_dict(diff: str, file_paths: List[str]) -> Dict[str, Any]:
     """
     files = {}
 
-    current_file = None
-    current_patch = []
-
-    for line in diff.split("\n"):
-        # Detect file header
-        if line.startswith("diff --git"):
-            # Save previous file
-            if current_file:
-                files[current_file] = "\n".join(current_patch)
-
-            # Extract file path
-            match = line.split(" b/")
-            if len(match) > 1:
-                current_file = match[1]
-                current_patch = []
-        elif current_file:
-            current_patch.append(line)
+    # Locate file headers in one scan; each patch is then a single slice of the diff
+    headers = [match for match in _DIFF_HEADER_RE.finditer(diff) if " b/" in match.group()]
 
-    # Save last file
-    if current_file:
-        files[current_file] = "\n".join(current_patch)
+    for index, header in enumerate(headers):
+        # Patch runs from the line after the header to the newline before the next one
+        start = header.end() + 1
+        end = headers[index + 1].start() - 1 if index + 1 < len(headers) else len(diff)
+        files[header.group().split(" b/")[1]] = diff[start:end]
 
     return {"files": files}
 
@@ -412,10 +497,8 @@ def _extract_iteration_from_labels(labels: List[str]) -> int:
     Returns:
         Iteration number (default 1)
     """
-    import re
-
     for label in labels:
-        match = re.match(r"iteration-(\d+)", label.lower())
+        match = _ITER_RE.match(label)
         if match:
             return int(match.group(1))
 
@@ -431,6 +514,12 @@ def _format_summary_comment(review: ReviewOutput) -> str:
     Returns:
         Formatted markdown summary
     """
+    requirements_section = []
+    if review.requirements_fulfilled:
+        fulfilled = sum(review.requirements_fulfilled)
+        total = len(review.requirements_fulfilled)
+        requirements_section = [f"## Requirements: {fulfilled}/{total} fulfilled", ""]
+
     lines = [
         f"# AI Code Review - Iteration {review.iteration}",
         "",
@@ -440,36 +529,24 @@ def _format_summary_comment(review: ReviewOutput) -> str:
         "## Summary",
         review.summary,
         "",
+        *_bullet_section("## 🚫 Blocking Issues", review.blocking_issues),
+        *_bullet_section("## ⚠️ Non-Blocking Issues", review.non_blocking_issues),
+        *_bullet_section(
+            "## CI Results", [f"**{key}**: {value}" for key, value in review.ci_summary.items()]
+        ),
+        *requirements_section,
+        "---",
+        f"*Generated at {review.timestamp.isoformat()}*",
     ]
 
-    if review.blocking_issues:
-        lines.append("## 🚫 Blocking Issues")
-        for issue in review.blocking_issues:
-            lines.append(f"- {issue}")
-        lines.append("")
-
-    if review.non_blocking_issues:
-        lines.append("## ⚠️ Non-Blocking Issues")
-        for issue in review.non_blocking_issues:
-            lines.append(f"- {issue}")
-        lines.append("")
-
-    if review.ci_summary:
-        lines.append("## CI Results")
-        for key, value in review.ci_summary.items():
-            lines.append(f"- **{key}**: {value}")
-        lines.append("")
+    return "\n".join(lines)
 
-    if review.requirements_fulfilled:
-        fulfilled = sum(review.requirements_fulfilled)
-        total = len(review.requirements_fulfilled)
-        lines.append(f"## Requirements: {fulfilled}/{total} fulfilled")
-        lines.append("")
 
-    lines.append("---")
-    lines.append(f"*Generated at {review.timestamp.isoformat()}*")
-
-    return "\n".join(lines)
+def _bullet_section(title: str, items: List[str]) -> List[str]:
+    """Format a titled markdown bullet list, or nothing if there are no items."""
+    if not items:
+        return []
+    return [title, *(f"- {item}" for item in items), ""]
 
 
 @click.group()
@@ -484,12 +561,14 @@ def cli():
 @click.option("--artifact-dir", required=True, help="Directory with CI artifacts")
 @click.option("--output", required=True, help="Output JSON file for review results")
 @click.option("--post-review", is_flag=True, help="Post review to GitHub")
+@click.option("--no-cache", is_flag=True, help="Ignore cached reviews and LLM analyses")
 def review(
     pr_number: int,
     issue_number: Optional[int],
     artifact_dir: str,
     output: str,
     post_review: bool,
+    no_cache: bool,
 ):
     """Analyze a pull request and generate review.
 
@@ -501,22 +580,32 @@ def review(
 
         logger.info(f"Starting review of PR #{pr_number}")
 
-        # Analyze PR
-        review_output = analyze_pr(pr_number, issue_number, artifact_dir, config)
+        # One client (and connection pool) serves both analysis and posting
+        github_client = GitHubClient(config)
+
+        try:
+            # Analyze PR
+            review_output = analyze_pr(
+                pr_number, issue_number, artifact_dir, config, github_client,
+                use_cache=not no_cache,
+            )
 
-        # Save to output file
-        output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Save to output file
+            output_path = Path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(review_output.model_dump(mode="json"), f, indent=2, default=str)
+            # Serialize in one pass with pydantic-core
+            output_path.write_text(review_output.model_dump_json(indent=2), encoding="utf-8")
 
-        logger.info(f"Review saved to {output}")
+            logger.info(f"Review saved to {output}")
 
-        # Post to GitHub if requested
-        if post_review:
-            logger.info("Posting review to GitHub...")
-            post_review_idempotent(pr_number, review_output, config)
+            # Post to GitHub if requested
+            if post_review:
+                logger.info("Posting review to GitHub...")
+                post_review_idempotent(pr_number, review_output, config, github_client)
+
+        finally:
+            github_client.close()
 
         # Exit with appropriate code
         if review_output.approve:
@@ -544,10 +633,7 @@ def post(review_file: str, pr_number: int):
         config = load_config()
 
         # Load review from file
-        with open(review_file, "r") as f:
-            review_data = json.load(f)
-
-        review_output = ReviewOutput.model_validate(review_data)
+        review_output = ReviewOutput.model_validate_json(Path(review_file).read_bytes())
 
         # Post to GitHub
         post_review_idempotent(pr_number, review_output, config)
@@ -0,0 +1,41 @@
+"""Tests for diff position lookup in the analysis engine."""
+
+import pytest
+
+from src.reviewer_agent.analysis_engine import _index_patch, find_diff_position
+
+# Positions count patch lines from 1, starting at the first hunk header
+PATCH = "\n".join(
+    [
+        "@@ -1,3 +1,4 @@",  # 1
+        " a",  # 2 -> line 1
+        "-b",  # 3
+        "+B",  # 4 -> line 2
+        "+c",  # 5 -> line 3
+        " d",  # 6 -> line 4
+        "@@ -10,2 +11,0 @@",  # 7: pure deletion, no new-file lines
+        "-x",  # 8
+        "-y",  # 9
+        "@@ -20,2 +20,2 @@",  # 10
+        " p",  # 11 -> line 20
+        "-q",  # 12
+        "\\ No newline at end of file",  # 13
+        "+Q",  # 14 -> line 21
+        "\\ No newline at end of file",  # 15
+        "",  # 16: text after the final newline
+    ]
+)
+
+
+def test_index_patch_positions():
+    assert _index_patch(PATCH) == {1: 2, 2: 4, 3: 5, 4: 6, 20: 11, 21: 14}
+
+
+@pytest.mark.parametrize(
+    ("line", "position"),
+    [(1, 2), (3, 5), (4, 6), (11, None), (20, 11), (21, 14), (22, None)],
+)
+def test_find_diff_position(line, position):
+    diff_data = {"files": {"src/app.py": PATCH}}
+
+    assert find_diff_position(diff_data, "src/app.py", line) == position
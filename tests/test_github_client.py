@@ -0,0 +1,158 @@
+"""Tests for GitHubClient.dismiss_and_post_review."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from github import GithubException
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from src.code_agent import github_client
+from src.code_agent.github_client import GitHubClient
+from src.common.models import ReviewOutput
+
+BOT = GitHubClient.BOT_IDENTIFIER
+
+
+def _review(review_id: int, state: str, body: str = "", login: str = BOT) -> MagicMock:
+    review = MagicMock()
+    review.id = review_id
+    review.state = state
+    review.body = body
+    review.user.login = login
+    review.raw_data = {"node_id": f"R_{review_id}"}
+    return review
+
+
+@pytest.fixture
+def review_data() -> ReviewOutput:
+    return ReviewOutput(approve=False, summary="Looks fine", iteration=2)
+
+
+@pytest.fixture
+def stale() -> MagicMock:
+    return _review(1, "CHANGES_REQUESTED", "## AI Code Review - Iteration 1\n")
+
+
+@pytest.fixture
+def pr(stale: MagicMock) -> MagicMock:
+    gh_pr = MagicMock()
+    gh_pr.number = 7
+    gh_pr.raw_data = {"node_id": "PR_7"}
+    gh_pr.get_reviews.return_value = [stale]
+    return gh_pr
+
+
+@pytest.fixture
+def client(pr: MagicMock, monkeypatch: pytest.MonkeyPatch) -> GitHubClient:
+    monkeypatch.setattr(github_client, "Github", MagicMock())
+    config = MagicMock()
+    config.get_github_token.return_value = "token"
+    config.github_repository = "owner/repo"
+
+    client = GitHubClient(config)
+    client.repo = MagicMock()
+    client.repo.get_pull.return_value = pr
+    client.post_review = MagicMock()
+    client.dismiss_old_bot_reviews = MagicMock()
+    client._dismiss_reviews = MagicMock(side_effect=lambda reviews: len(reviews))
+    return client
+
+
+def _requester(client: GitHubClient) -> MagicMock:
+    return client.repo._requester
+
+
+def test_graphql_success_posts_nothing_over_rest(client, review_data):
+    data = {
+        "dismiss0": {"pullRequestReview": {"id": "R_1"}},
+        "addReview": {"pullRequestReview": {"id": "R_2"}},
+    }
+    _requester(client).graphql_query.return_value = ({}, {"data": data})
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    query, variables = _requester(client).graphql_query.call_args.args
+    assert "dismiss0: dismissPullRequestReview" in query
+    assert variables["review0"] == "R_1"
+    client._dismiss_reviews.assert_not_called()
+    client.post_review.assert_not_called()
+
+
+def test_graphql_errors_with_partial_data_dismiss_the_rest(client, review_data, stale):
+    partial = {
+        "data": {"dismiss0": None, "addReview": {"pullRequestReview": {"id": "R_2"}}},
+        "errors": [{"message": "not permitted"}],
+    }
+    _requester(client).graphql_query.side_effect = GithubException(400, partial, {})
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    client._dismiss_reviews.assert_called_once_with([stale])
+    client.post_review.assert_not_called()
+
+
+def test_graphql_4xx_falls_back_to_rest(client, review_data):
+    _requester(client).graphql_query.side_effect = GithubException(
+        401, {"message": "Bad credentials"}, {}
+    )
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    client.dismiss_old_bot_reviews.assert_called_once_with(7)
+    client.post_review.assert_called_once_with(7, review_data, "COMMENT")
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        GithubException(502, {"message": "Bad Gateway"}, {}),
+        requests.exceptions.ReadTimeout("read timed out"),
+    ],
+)
+def test_unknown_outcome_does_not_post_twice(client, review_data, pr, stale, error):
+    _requester(client).graphql_query.side_effect = error
+    posted = _review(2, "COMMENTED", client._build_review_body(review_data))
+    dismissed = _review(1, "DISMISSED", stale.body)
+    pr.get_reviews.side_effect = [[stale], [dismissed, posted]]
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    client.post_review.assert_not_called()
+    client.dismiss_old_bot_reviews.assert_not_called()
+    client._dismiss_reviews.assert_not_called()
+
+
+def test_unknown_outcome_posts_when_review_is_missing(client, review_data, pr, stale):
+    _requester(client).graphql_query.side_effect = requests.exceptions.ReadTimeout("timed out")
+    pr.get_reviews.side_effect = [[stale], [stale]]
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    client._dismiss_reviews.assert_called_once_with([stale])
+    client.post_review.assert_called_once_with(7, review_data, "COMMENT")
+
+
+def test_connection_failure_falls_back_to_rest(client, review_data):
+    reason = NewConnectionError(None, "Failed to establish a new connection")
+    _requester(client).graphql_query.side_effect = requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/graphql", reason)
+    )
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    client.dismiss_old_bot_reviews.assert_called_once_with(7)
+    client.post_review.assert_called_once_with(7, review_data, "COMMENT")
+
+
+def test_missing_add_review_checks_before_posting(client, review_data, pr, stale):
+    _requester(client).graphql_query.return_value = (
+        {},
+        {"data": {"dismiss0": {"pullRequestReview": {"id": "R_1"}}, "addReview": None}},
+    )
+    posted = _review(2, "COMMENTED", client._build_review_body(review_data))
+    pr.get_reviews.side_effect = [[stale], [_review(1, "DISMISSED"), posted]]
+
+    client.dismiss_and_post_review(7, review_data, "COMMENT")
+
+    client.post_review.assert_not_called()
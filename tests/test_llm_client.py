@@ -0,0 +1,48 @@
+"""Tests for the LLM client concurrency limiter."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.code_agent.llm_client import AdaptiveLimiter
+
+
+def test_limit_grows_after_successes():
+    limiter = AdaptiveLimiter(initial_limit=4.0, max_limit=5.0)
+
+    limiter.on_success()
+    assert limiter.limit == pytest.approx(4.25)
+
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.limit == 5.0
+
+
+def test_limit_halves_on_rate_limit():
+    limiter = AdaptiveLimiter(initial_limit=8.0, min_limit=1.0)
+
+    limiter.on_rate_limited()
+    assert limiter.limit == 4.0
+
+    for _ in range(5):
+        limiter.on_rate_limited()
+    assert limiter.limit == 1.0
+
+
+def test_async_waiter_is_woken_by_sync_release():
+    limiter = AdaptiveLimiter(initial_limit=1.0)
+    limiter.acquire()
+
+    async def main() -> None:
+        waiter = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        # Release from a plain thread, as a synchronous call would
+        threading.Thread(target=limiter.release).start()
+        await asyncio.wait_for(waiter, timeout=2.0)
+
+    asyncio.run(main())
+    assert limiter.in_flight == 1
+    assert limiter._async_waiters == []
@@ -0,0 +1,124 @@
+"""Tests for StateManager's background writer and legacy JSON migration."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.code_agent.state_manager import StateManager
+from src.common.models import AgentState
+
+
+@pytest.fixture
+def manager(tmp_path: Path):
+    manager = StateManager(tmp_path)
+    yield manager
+    try:
+        manager.close()
+    except RuntimeError:
+        pass
+
+
+@pytest.fixture
+def write_lock(manager: StateManager):
+    """Hold the database write lock so the writer thread's saves stay queued."""
+    blocker = sqlite3.connect(manager.state_dir / StateManager.DB_FILENAME, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    yield blocker
+    if blocker.in_transaction:
+        blocker.execute("COMMIT")
+    blocker.close()
+
+
+def _stored_status(manager: StateManager, issue_number: int):
+    row = manager.conn.execute(
+        "SELECT data FROM states WHERE issue_number = ?", (issue_number,)
+    ).fetchone()
+    if row is None:
+        return None
+    # Small states are stored as plain JSON
+    return AgentState.model_validate_json(row[0]).status
+
+
+def test_load_sees_queued_save_before_it_is_written(manager, write_lock):
+    manager.save_state(AgentState(issue_number=1, status="in_progress"))
+
+    assert _stored_status(manager, 1) is None
+    assert manager.load_state(1).status == "in_progress"
+    assert manager.list_all_states() == [1]
+
+    write_lock.execute("COMMIT")
+    manager.flush()
+
+    assert _stored_status(manager, 1) == "in_progress"
+    assert manager._pending == {}
+
+
+def test_newer_save_supersedes_queued_one(manager, write_lock):
+    manager.save_state(AgentState(issue_number=1, status="in_progress"))
+    manager.save_state(AgentState(issue_number=1, status="completed"))
+
+    assert manager.load_state(1).status == "completed"
+
+    write_lock.execute("COMMIT")
+    manager.flush()
+
+    assert _stored_status(manager, 1) == "completed"
+    assert manager.load_state(1).status == "completed"
+    assert manager._pending == {}
+
+
+def _fail_writes(manager: StateManager) -> None:
+    manager.conn.execute(
+        "CREATE TRIGGER fail_writes BEFORE INSERT ON states "
+        "BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+    )
+
+
+def test_flush_raises_recorded_write_error(manager):
+    _fail_writes(manager)
+    manager.save_state(AgentState(issue_number=1, status="in_progress"))
+
+    with pytest.raises(RuntimeError, match="#1") as excinfo:
+        manager.flush()
+    assert isinstance(excinfo.value.__cause__, sqlite3.Error)
+
+    # The failed save stays readable and the error is only reported once
+    assert manager.load_state(1).status == "in_progress"
+    manager.flush()
+
+
+def test_close_raises_recorded_write_error(manager):
+    _fail_writes(manager)
+    manager.save_state(AgentState(issue_number=2))
+
+    with pytest.raises(RuntimeError, match="#2") as excinfo:
+        manager.close()
+    assert isinstance(excinfo.value.__cause__, sqlite3.Error)
+
+
+def test_save_after_close_raises(manager):
+    manager.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        manager.save_state(AgentState(issue_number=1))
+
+
+def test_migrates_legacy_json_files(tmp_path: Path):
+    legacy = AgentState(issue_number=5, iteration=3, status="stuck")
+    (tmp_path / "issue-5.json").write_text(legacy.model_dump_json(), encoding="utf-8")
+    (tmp_path / "issue-6.json").write_text("{not json", encoding="utf-8")
+
+    manager = StateManager(tmp_path)
+    try:
+        state = manager.load_state(5)
+        assert state is not None
+        assert (state.iteration, state.status) == (3, "stuck")
+        assert not (tmp_path / "issue-5.json").exists()
+        assert (tmp_path / "issue-5.json.migrated").exists()
+
+        # Unreadable files are left in place
+        assert (tmp_path / "issue-6.json").exists()
+        assert manager.list_all_states() == [5]
+    finally:
+        manager.close()